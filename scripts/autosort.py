@@ -127,6 +127,26 @@ CATEGORY_RULES = {
 }
 
 
+# Deterministic tag detection: tag -> lowercase keywords searched in the file
+TAG_KEYWORDS = {
+    "3d": ["three.js", "webgl", "3d"],
+    "canvas": ["getcontext", "<canvas"],
+    "svg": ["<svg", "createelementns"],
+    "animation": ["requestanimationframe", "animation", "@keyframes"],
+    "audio": ["audiocontext", "oscillator", "<audio"],
+    "particles": ["particle", "emitter"],
+    "physics": ["velocity", "gravity", "collision"],
+    "interactive": ["addeventlistener", "onclick", "touch"],
+    "game": ["score", "game over", "player", "level"],
+    "ai": ["neural", "ai", "machine learning", "gpt"],
+    "creative": ["draw", "paint", "brush", "palette"],
+    "terminal": ["terminal", "console", "command"],
+    "retro": ["retro", "pixel", "8-bit", "emulat"],
+    "simulation": ["simulat", "ecosystem", "evolv"],
+    "crm": ["crm", "salesforce", "dynamics"],
+}
+
+
 # ─── HTML Parser ─────────────────────────────────────────────────────────────
 
 
@@ -198,28 +218,9 @@ def extract_metadata(filepath):
     file_size = filepath.stat().st_size
 
     # Detect tags deterministically (no LLM needed for this)
-    tags = []
     content_lower = content.lower()
-    tag_checks = {
-        "3d": ["three.js", "webgl", "3d"],
-        "canvas": ["getcontext", "<canvas"],
-        "svg": ["<svg", "createelementns"],
-        "animation": ["requestanimationframe", "animation", "@keyframes"],
-        "audio": ["audiocontext", "oscillator", "<audio"],
-        "particles": ["particle", "emitter"],
-        "physics": ["velocity", "gravity", "collision"],
-        "interactive": ["addeventlistener", "onclick", "touch"],
-        "game": ["score", "game over", "player", "level"],
-        "ai": ["neural", "ai", "machine learning", "gpt"],
-        "creative": ["draw", "paint", "brush", "palette"],
-        "terminal": ["terminal", "console", "command"],
-        "retro": ["retro", "pixel", "8-bit", "emulat"],
-        "simulation": ["simulat", "ecosystem", "evolv"],
-        "crm": ["crm", "salesforce", "dynamics"],
-    }
-    for tag, keywords in tag_checks.items():
-        if any(kw in content_lower for kw in keywords):
-            tags.append(tag)
+    tags = [tag for tag, keywords in TAG_KEYWORDS.items()
+            if any(kw in content_lower for kw in keywords)]
 
     # Determine complexity deterministically
     if file_size > 50000 or "3d" in tags:
@@ -522,7 +523,7 @@ def analyze_with_keywords(filename, meta, verbose=False):
     new_name = generate_filename_fallback(meta, filename)
 
     # Determine interaction type
-    tags = meta["tags"]
+    tags = frozenset(meta["tags"])
     if "game" in tags:
         itype = "game"
     elif "audio" in tags:
@@ -12,6 +12,7 @@ No data is better than bad data.
 
 import hashlib
 import json
+import threading
 from datetime import date
 from pathlib import Path
 from typing import Optional
@@ -27,6 +28,9 @@ from copilot_utils import (
 
 IDENTITY_CACHE = APPS_DIR / "content-identities.json"
 
+# Serializes cache read-modify-write when analyze() runs on worker threads
+_cache_lock = threading.Lock()
+
 
 def _file_hash(content: str) -> str:
     """SHA-256 fingerprint for cache invalidation."""
@@ -160,10 +164,11 @@ def analyze(filepath, content=None, use_cache=True) -> Optional[dict]:
 
     # Update cache
     if use_cache:
-        cache = _load_cache()
         key = str(filepath.relative_to(ROOT)) if str(filepath).startswith(str(ROOT)) else str(filepath)
-        cache[key] = identity
-        _save_cache(cache)
+        with _cache_lock:
+            cache = _load_cache()
+            cache[key] = identity
+            _save_cache(cache)
 
     return identity
 
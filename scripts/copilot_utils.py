@@ -191,8 +191,7 @@ def parse_llm_html(raw_output):
 def load_manifest():
     """Load the manifest or create a fresh one."""
     if MANIFEST_PATH.exists():
-        with open(MANIFEST_PATH) as f:
-            return json.load(f)
+        return json.loads(MANIFEST_PATH.read_bytes())
     return {"categories": {}, "meta": {"version": "1.0", "lastUpdated": ""}}
 
 
@@ -202,6 +201,6 @@ def save_manifest(manifest):
 
     manifest["meta"]["lastUpdated"] = date.today().isoformat()
     tmp = MANIFEST_PATH.with_suffix(".tmp")
-    with open(tmp, "w") as f:
-        json.dump(manifest, f, indent=2)
+    # One encode and one write; json.dump would issue a write per token
+    tmp.write_bytes(json.dumps(manifest, indent=2).encode("utf-8"))
     tmp.replace(MANIFEST_PATH)
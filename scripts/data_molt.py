@@ -43,7 +43,7 @@ PROTECTED_FILES = {
 KNOWN_STRATEGIES = {
     "community.json": {
         "script": "generate_community.py",
-        "args": [],
+        "args": ["--force"],
         "description": "Regenerate community data via Copilot CLI",
     },
     "broadcasts/feed.json": {
@@ -2,12 +2,15 @@
 """Generate community data for RappterZoo — 100% dynamic via Copilot CLI.
 
 Every piece of text content is generated fresh by Claude Opus 4.6.
-No templates. No caches. No reuse. Every run produces entirely unique content.
+No templates. No reuse. Every generation produces entirely unique content.
+A run is skipped when manifest.json and rankings.json are unchanged since the
+last generation (meta.inputHash); pass --force to regenerate anyway.
 
 Usage:
     python3 scripts/generate_community.py              # Generate community.json
     python3 scripts/generate_community.py --verbose     # Show progress
     python3 scripts/generate_community.py --push        # Generate + commit + push
+    python3 scripts/generate_community.py --force       # Regenerate even if inputs unchanged
 
 Output: apps/community.json
 """
@@ -16,9 +19,14 @@ import json
 import hashlib
 import random
 import sys
+import threading
 import time
+import zlib
+from itertools import accumulate
+from operator import itemgetter
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 
 sys.path.insert(0, str(Path(__file__).resolve().parent))
 from copilot_utils import detect_backend, copilot_call, parse_llm_json, MODEL
@@ -31,6 +39,11 @@ OUTPUT = APPS_DIR / "community.json"
 
 VERBOSE = "--verbose" in sys.argv
 
+# Concurrent Copilot CLI calls for comment batches (bounded to stay polite)
+COMMENT_WORKERS = 3
+# Minimum seconds between starting two comment batch calls
+COMMENT_BATCH_INTERVAL = 1.0
+
 
 def vprint(*args):
     if VERBOSE:
@@ -39,9 +52,23 @@ def vprint(*args):
 
 # ── Player Generation (pure LLM) ─────────────────────────────────────────
 
+ACTIVITY_LEVELS = ("casual", "regular", "active", "hardcore", "legendary")
+ACTIVITY_WEIGHTS = (30, 25, 20, 15, 10)
+GAMES_PLAYED_RANGES = {
+    "casual": (1, 10), "regular": (8, 30), "active": (20, 80),
+    "hardcore": (50, 150), "legendary": (100, 300),
+}
+FAVORITE_CATEGORIES = (
+    "games_puzzles", "visual_art", "3d_immersive", "audio_music",
+    "generative_art", "particle_physics", "creative_tools",
+    "experimental_ai", "educational_tools",
+)
+
+
 def generate_players_llm(n=250):
     """Generate n unique player profiles via Copilot CLI. Zero templates."""
     players = []
+    seen_names = set()
     batch_size = 50  # 50 players per LLM call
 
     for batch_start in range(0, n, batch_size):
@@ -67,27 +94,26 @@ Return ONLY the JSON array. No explanation."""
         parsed = parse_llm_json(raw) if raw else None
 
         if parsed and isinstance(parsed, list):
-            for i, p in enumerate(parsed[:batch_n]):
+            profiles = parsed[:batch_n]
+            now = datetime.now()
+            # Draw every categorical field for the batch up front
+            levels = random.choices(ACTIVITY_LEVELS, weights=ACTIVITY_WEIGHTS,
+                                    k=len(profiles))
+            fav_cats = random.choices(FAVORITE_CATEGORIES, k=len(profiles))
+            join_days = random.choices(range(1, 366), k=len(profiles))
+            for i, (p, activity_level, fav_cat, join_days_ago) in enumerate(
+                    zip(profiles, levels, fav_cats, join_days)):
                 idx = batch_start + i
-                join_days_ago = random.randint(1, 365)
-                join_date = (datetime.now() - timedelta(days=join_days_ago)).strftime("%Y-%m-%d")
-                activity_level = random.choices(
-                    ["casual", "regular", "active", "hardcore", "legendary"],
-                    weights=[30, 25, 20, 15, 10]
-                )[0]
-                games_played = {
-                    "casual": random.randint(1, 10), "regular": random.randint(8, 30),
-                    "active": random.randint(20, 80), "hardcore": random.randint(50, 150),
-                    "legendary": random.randint(100, 300),
-                }[activity_level]
-                fav_cat = random.choice([
-                    "games_puzzles", "visual_art", "3d_immersive", "audio_music",
-                    "generative_art", "particle_physics", "creative_tools",
-                    "experimental_ai", "educational_tools",
-                ])
+                join_date = (now - timedelta(days=join_days_ago)).strftime("%Y-%m-%d")
+                games_played = random.randint(*GAMES_PLAYED_RANGES[activity_level])
+                # Suffixing with the unique index resolves a clash in one probe
+                username = p.get("username", f"Player{idx}")
+                if username in seen_names:
+                    username = f"{username}_{idx}"
+                seen_names.add(username)
                 players.append({
                     "id": f"p{idx:04d}",
-                    "username": p.get("username", f"Player{idx}"),
+                    "username": username,
                     "color": p.get("color", "#888"),
                     "joinDate": join_date,
                     "bio": p.get("bio", ""),
@@ -100,13 +126,14 @@ Return ONLY the JSON array. No explanation."""
                 })
         else:
             vprint(f"    Player batch failed — generating fallback names")
+            today = datetime.now().strftime("%Y-%m-%d")
             for i in range(batch_n):
                 idx = batch_start + i
                 players.append({
                     "id": f"p{idx:04d}",
                     "username": f"Player{idx}",
-                    "color": f"#{random.randint(0,0xFFFFFF):06x}",
-                    "joinDate": datetime.now().strftime("%Y-%m-%d"),
+                    "color": f"#{random.getrandbits(24):06x}",
+                    "joinDate": today,
                     "bio": "", "gamesPlayed": 1, "totalScore": 50,
                     "favoriteCategory": "games_puzzles",
                     "activityLevel": "casual",
@@ -119,7 +146,53 @@ Return ONLY the JSON array. No explanation."""
 
 # ── Comment Generation (pure LLM, per-app, zero reuse) ───────────────────
 
-def generate_comments_for_app_llm(app, cat_key, cat_title, players, rankings_data):
+def index_rankings(rankings_data):
+    """Map app filename -> its rankings.json entry (first entry wins)."""
+    by_file = {}
+    for r in (rankings_data or {}).get("rankings", []):
+        by_file.setdefault(r.get("file"), r)
+    return by_file
+
+
+# Comment timestamps are computed in epoch seconds and formatted with this
+ISO_SECONDS = "%Y-%m-%dT%H:%M:%S"
+
+# (author, authorId, authorColor) stamped on every moderator comment
+MODERATOR_IDENTITY = ("ArcadeKeeper", "mod-001", "#ff4500")
+
+# Static tail of the single-app thread prompt (comment schema, rules and the
+# moderator comment template), built once instead of per f-string call
+THREAD_PROMPT_RULES = """{
+  "author": "one of the usernames above",
+  "text": "the comment text",
+  "reply_to": null or 0-based index of parent comment
+}
+
+RULES:
+- Every comment must be COMPLETELY UNIQUE text — never reused anywhere
+- 60% should be top-level observations, 40% should be replies to earlier comments
+- Include 1-2 constructive criticisms or suggestions
+- If score < 50, comments should note rough edges honestly
+- If score > 80, comments can be more enthusiastic but still specific
+- Replies must directly reference what the parent said
+- Casual lowercase reddit/discord voice
+- React to the ACTUAL tags, type, and mechanics — be specific
+- Don't repeat the full title in every comment — use "it", "this", short name
+- Vary tone: technical, emotional, humor, comparison, casual
+- Each comment: 15-100 words
+
+Also include one moderator comment:
+{
+  "author": "ArcadeKeeper",
+  "text": "[ArcadeKeeper] <technical review using the actual score, grade, tags, generation>",
+  "reply_to": null,
+  "is_mod": true
+}
+
+"""
+
+
+def generate_comments_for_app_llm(app, cat_key, cat_title, players, rankings_by_file):
     """Generate a full comment thread for ONE app via Copilot CLI.
 
     Every comment is unique. Nothing is reused from any other app.
@@ -132,14 +205,9 @@ def generate_comments_for_app_llm(app, cat_key, cat_title, players, rankings_dat
     gen = app.get("generation", 0)
 
     # Get ranking score if available
-    score = 0
-    grade = "?"
-    if rankings_data:
-        for r in rankings_data.get("rankings", []):
-            if r.get("file") == app["file"]:
-                score = r.get("score", 0)
-                grade = r.get("grade", "?")
-                break
+    r = rankings_by_file.get(app["file"], {})
+    score = r.get("score", 0)
+    grade = r.get("grade", "?")
 
     # Pick random player names for the prompt
     rng = random.Random(app["file"] + str(time.time()))
@@ -165,34 +233,7 @@ AVAILABLE USERNAMES (assign each comment to a different one):
 {json.dumps(usernames[:num_comments + 4])}
 
 Generate exactly {num_comments} comments as a JSON array. Each comment:
-{{
-  "author": "one of the usernames above",
-  "text": "the comment text",
-  "reply_to": null or 0-based index of parent comment
-}}
-
-RULES:
-- Every comment must be COMPLETELY UNIQUE text — never reused anywhere
-- 60% should be top-level observations, 40% should be replies to earlier comments
-- Include 1-2 constructive criticisms or suggestions
-- If score < 50, comments should note rough edges honestly
-- If score > 80, comments can be more enthusiastic but still specific
-- Replies must directly reference what the parent said
-- Casual lowercase reddit/discord voice
-- React to the ACTUAL tags, type, and mechanics — be specific
-- Don't repeat the full title in every comment — use "it", "this", short name
-- Vary tone: technical, emotional, humor, comparison, casual
-- Each comment: 15-100 words
-
-Also include one moderator comment:
-{{
-  "author": "ArcadeKeeper",
-  "text": "[ArcadeKeeper] <technical review using the actual score, grade, tags, generation>",
-  "reply_to": null,
-  "is_mod": true
-}}
-
-Return ONLY the JSON array."""
+{THREAD_PROMPT_RULES}Return ONLY the JSON array."""
 
     raw = copilot_call(prompt, timeout=60)
     parsed = parse_llm_json(raw) if raw else None
@@ -201,10 +242,11 @@ Return ONLY the JSON array."""
         return None
 
     # Assemble into comment objects
-    base_time = datetime.now() - timedelta(days=rng.randint(1, 60))
+    base_epoch = time.time() - rng.randint(1, 60) * 86400
     comments = []
     top_level = []
     player_map = {p["username"]: p for p in thread_players}
+    id_prefix = hashlib.md5((app["file"] + "-").encode())
 
     for i, item in enumerate(parsed):
         if not isinstance(item, dict):
@@ -221,19 +263,26 @@ Return ONLY the JSON array."""
         if not player and not is_mod:
             player = rng.choice(thread_players)
 
-        comment_time = base_time + timedelta(hours=rng.randint(0, 48 * (i + 1)))
+        comment_epoch = base_epoch + rng.randint(0, 48 * (i + 1)) * 3600
+        if is_mod:
+            author, author_id, author_color = MODERATOR_IDENTITY
+        elif player:
+            author, author_id, author_color = player["username"], player["id"], player["color"]
+        else:
+            author, author_id, author_color = author_name, f"p{i:04d}", "#888"
+        id_hash = id_prefix.copy()
+        id_hash.update((str(i) + str(time.time())).encode())
         comment = {
-            "id": "c" + hashlib.md5((app["file"] + "-" + str(i) + str(time.time())).encode()).hexdigest()[:8],
-            "author": "ArcadeKeeper" if is_mod else (player["username"] if player else author_name),
-            "authorId": "mod-001" if is_mod else (player["id"] if player else f"p{i:04d}"),
-            "authorColor": "#ff4500" if is_mod else (player["color"] if player else "#888"),
+            "id": "c" + id_hash.hexdigest()[:8],
+            "author": author,
+            "authorId": author_id,
+            "authorColor": author_color,
             "text": text,
-            "timestamp": comment_time.isoformat(),
+            "timestamp": time.strftime(ISO_SECONDS, time.localtime(comment_epoch)),
             "upvotes": rng.randint(1, 50),
             "downvotes": rng.randint(0, 5),
             "version": max(1, gen) if gen > 0 else 1,
             "parentId": None,
-            "children": [],
         }
         if is_mod:
             comment["isModerator"] = True
@@ -242,7 +291,7 @@ Return ONLY the JSON array."""
             parent = top_level[reply_to]
             comment["parentId"] = parent["id"]
             comment["upvotes"] = rng.randint(1, 20)
-            parent["children"].append(comment)
+            parent.setdefault("children", []).append(comment)
         else:
             comments.append(comment)
             top_level.append(comment)
@@ -250,7 +299,7 @@ Return ONLY the JSON array."""
     return comments if comments else None
 
 
-def generate_comments_batch_llm(batch, players, rankings_data):
+def generate_comments_batch_llm(batch, players, rankings_by_file):
     """Generate comments for a batch of 5 apps in one LLM call.
 
     More efficient than per-app calls. Every comment still unique.
@@ -258,30 +307,24 @@ def generate_comments_batch_llm(batch, players, rankings_data):
     apps_data = []
     for app_info in batch:
         app = app_info["app"]
-        score = 0
-        grade = "?"
-        if rankings_data:
-            for r in rankings_data.get("rankings", []):
-                if r.get("file") == app["file"]:
-                    score = r.get("score", 0)
-                    grade = r.get("grade", "?")
-                    break
+        filename = app["file"]
+        r = rankings_by_file.get(filename, {})
         apps_data.append({
-            "file": app["file"],
+            "file": filename,
             "title": app.get("title", ""),
             "description": app.get("description", ""),
             "tags": app.get("tags", []),
             "complexity": app.get("complexity", "intermediate"),
             "type": app.get("type", "interactive"),
             "category": app_info["catTitle"],
-            "score": score,
-            "grade": grade,
+            "score": r.get("score", 0),
+            "grade": r.get("grade", "?"),
             "generation": app.get("generation", 0),
         })
 
     rng = random.Random(str(time.time()))
-    sample_players = rng.sample(players, min(40, len(players)))
-    usernames = [p["username"] for p in sample_players]
+    picks = rng.sample(range(len(players)), min(40, len(players)))
+    usernames = [players[k]["username"] for k in picks]
 
     prompt = f"""Generate unique comment threads for {len(apps_data)} apps in the RappterZoo browser game arcade.
 
@@ -321,39 +364,164 @@ Return ONLY the JSON. No explanation."""
     return parsed
 
 
+def generate_all_comments(apps_list, players, rankings_by_file):
+    """Generate comment threads for every app in batches of five.
+
+    Up to COMMENT_WORKERS batch calls are in flight at once, and each new
+    call starts at least COMMENT_BATCH_INTERVAL seconds after the previous
+    one. Returns (all_comments, total_comments).
+    """
+    all_comments = {}
+    total_comments = 0
+    batch_size = 5
+    starts = range(0, len(apps_list), batch_size)
+    total_batches = len(starts)
+    throttle = threading.Lock()
+    next_call = [0.0]
+
+    def run_batch(start):
+        with throttle:
+            wait = next_call[0] - time.monotonic()
+            if wait > 0:
+                time.sleep(wait)
+            next_call[0] = time.monotonic() + COMMENT_BATCH_INTERVAL
+        return generate_comments_batch_llm(
+            apps_list[start:start + batch_size], players, rankings_by_file)
+
+    # Batch LLM calls are independent, so keep a few in flight at once;
+    # map() still yields results in batch order for assembly below.
+    with ThreadPoolExecutor(max_workers=COMMENT_WORKERS) as comment_pool:
+        results = comment_pool.map(run_batch, starts)
+
+        for i, result in zip(starts, results):
+            batch = apps_list[i:i + batch_size]
+            batch_num = i // batch_size + 1
+
+            vprint(f"  Batch {batch_num}/{total_batches} ({len(batch)} apps)...")
+
+            # Assemble results into comment objects
+            rng = random.Random(str(time.time()) + str(i))
+            for app_info in batch:
+                app = app_info["app"]
+                filename = app["file"]
+                stem = filename.replace(".html", "")
+                gen = app.get("generation", 0)
+
+                raw_comments = result.get(filename) or result.get(stem)
+                if raw_comments and isinstance(raw_comments, list):
+                    # Build threaded comment objects
+                    base_epoch = time.time() - rng.randint(1, 60) * 86400
+                    comments = []
+                    top_level = []
+                    sample = rng.sample(players, min(len(raw_comments) + 4, len(players)))
+                    player_map = {p["username"]: p for p in sample}
+                    id_prefix = hashlib.md5(f"{filename}-".encode())
+                    pidx = 0
+
+                    for j, item in enumerate(raw_comments):
+                        if not isinstance(item, dict):
+                            continue
+                        text = item.get("text", "")
+                        if not text:
+                            continue
+                        author = item.get("author", "")
+                        reply_to = item.get("reply_to")
+                        is_mod = "ArcadeKeeper" in author or item.get("is_mod")
+
+                        player = player_map.get(author)
+                        if not player and not is_mod:
+                            if pidx < len(sample):
+                                player = sample[pidx]
+                                pidx += 1
+                            else:
+                                player = rng.choice(players)
+
+                        ct = base_epoch + rng.randint(0, 48 * (j + 1)) * 3600
+                        if is_mod:
+                            author, author_id, author_color = MODERATOR_IDENTITY
+                        elif player:
+                            author, author_id, author_color = (
+                                player["username"], player["id"], player["color"])
+                        else:
+                            author_id, author_color = "p0000", "#888"
+                        id_hash = id_prefix.copy()
+                        id_hash.update(f"{j}-{time.time()}".encode())
+                        comment = {
+                            "id": "c" + id_hash.hexdigest()[:8],
+                            "author": author,
+                            "authorId": author_id,
+                            "authorColor": author_color,
+                            "text": text,
+                            "timestamp": time.strftime(ISO_SECONDS, time.localtime(ct)),
+                            "upvotes": rng.randint(1, 50),
+                            "downvotes": rng.randint(0, 5),
+                            "version": max(1, gen) if gen > 0 else 1,
+                            "parentId": None,
+                        }
+                        if is_mod:
+                            comment["isModerator"] = True
+
+                        if reply_to is not None and isinstance(reply_to, int) and 0 <= reply_to < len(top_level):
+                            parent = top_level[reply_to]
+                            comment["parentId"] = parent["id"]
+                            comment["upvotes"] = rng.randint(1, 20)
+                            parent.setdefault("children", []).append(comment)
+                        else:
+                            comments.append(comment)
+                            top_level.append(comment)
+
+                    all_comments[stem] = comments
+                    total_comments += len(comments) + sum(
+                        len(c.get("children", [])) for c in comments)
+                else:
+                    # Single-app fallback
+                    single = generate_comments_for_app_llm(
+                        app, app_info["catKey"], app_info["catTitle"],
+                        players, rankings_by_file
+                    )
+                    if single:
+                        all_comments[stem] = single
+                        total_comments += len(single)
+
+            if (batch_num) % 10 == 0:
+                print(f"  [{i + len(batch)}/{len(apps_list)}] {total_comments} comments so far...")
+
+    return all_comments, total_comments
+
+
 # ── Ratings (correlated with actual quality) ─────────────────────────────
 
-def generate_ratings(apps_list, rankings_data):
+# (minimum quality score, star values, cumulative weights), checked top-down.
+# Cumulative weights let random.choices skip re-accumulating on every call.
+RATING_TIERS = tuple(
+    (floor, stars, tuple(accumulate(weights)))
+    for floor, stars, weights in (
+        (80, (3, 4, 5), (5, 25, 70)),
+        (60, (2, 3, 4, 5), (5, 20, 45, 30)),
+        (40, (1, 2, 3, 4), (10, 25, 40, 25)),
+        (float("-inf"), (1, 2, 3), (30, 40, 30)),
+    )
+)
+
+
+def generate_ratings(apps_list, rankings_by_file):
     """Generate ratings that correlate with actual app quality scores."""
     ratings = {}
     rng = random.Random(str(time.time()))
 
     for app_info in apps_list:
-        app = app_info["app"]
-        stem = app["file"].replace(".html", "")
+        filename = app_info["app"]["file"]
+        stem = filename.replace(".html", "")
 
         # Get actual quality score
-        quality = 50
-        if rankings_data:
-            for r in rankings_data.get("rankings", []):
-                if r.get("file") == app["file"]:
-                    quality = r.get("score", 50)
-                    break
+        quality = rankings_by_file.get(filename, {}).get("score", 50)
 
         # Ratings cluster around quality-appropriate stars
+        stars, cum_weights = next(
+            (stars, cum_weights) for floor, stars, cum_weights in RATING_TIERS
+            if quality >= floor)
         num_ratings = rng.randint(5, 50)
-        app_ratings = []
-        for _ in range(num_ratings):
-            if quality >= 80:
-                star = rng.choices([3, 4, 5], weights=[5, 25, 70])[0]
-            elif quality >= 60:
-                star = rng.choices([2, 3, 4, 5], weights=[5, 20, 45, 30])[0]
-            elif quality >= 40:
-                star = rng.choices([1, 2, 3, 4], weights=[10, 25, 40, 25])[0]
-            else:
-                star = rng.choices([1, 2, 3], weights=[30, 40, 30])[0]
-            app_ratings.append(star)
-        ratings[stem] = app_ratings
+        ratings[stem] = rng.choices(stars, cum_weights=cum_weights, k=num_ratings)
 
     return ratings
 
@@ -363,12 +531,13 @@ def generate_ratings(apps_list, rankings_data):
 def generate_activity_llm(apps_list, players, count=150):
     """Generate activity feed events via Copilot CLI."""
     rng = random.Random(str(time.time()))
-    sample_apps = rng.sample(apps_list, min(50, len(apps_list)))
-    sample_players = rng.sample(players, min(30, len(players)))
+    # Only 20 of each make it into the prompt, so draw exactly that many
+    sample_apps = rng.sample(apps_list, min(20, len(apps_list)))
+    player_picks = rng.sample(range(len(players)), min(20, len(players)))
 
     app_summaries = [{"title": a["app"]["title"], "file": a["app"]["file"],
-                      "category": a["catTitle"]} for a in sample_apps[:20]]
-    player_names = [p["username"] for p in sample_players[:20]]
+                      "category": a["catTitle"]} for a in sample_apps]
+    player_names = [players[k]["username"] for k in player_picks]
 
     prompt = f"""Generate {count} unique activity feed events for the RappterZoo game arcade.
 
@@ -396,36 +565,104 @@ Return ONLY the JSON array."""
     parsed = parse_llm_json(raw) if raw else None
 
     if parsed and isinstance(parsed, list):
-        # Enrich with player data
-        player_map = {p["username"]: p for p in players}
+        # Enrich with player data from per-player field templates
+        player_fields = {p["username"]: {"playerId": p["id"], "playerColor": p["color"]}
+                         for p in players}
+        now = datetime.now()
         for event in parsed:
-            p = player_map.get(event.get("player"))
-            if p:
-                event["playerId"] = p["id"]
-                event["playerColor"] = p["color"]
-            event["timestamp"] = (datetime.now() - timedelta(
-                minutes=event.get("minutesAgo", 1))).isoformat()
-        parsed.sort(key=lambda e: e.get("minutesAgo", 0))
+            fields = player_fields.get(event.get("player"))
+            if fields:
+                event.update(fields)
+            event["timestamp"] = (now - timedelta(
+                minutes=event.setdefault("minutesAgo", 1))).isoformat()
+        parsed.sort(key=itemgetter("minutesAgo"))
         return parsed
 
     return []
 
 
-def generate_online_schedule():
-    """Generate hourly online counts (simple math, no templates)."""
-    schedule = {}
+# Per-hour (lo, hi) bump over the base online count, indexed by hour of day.
+ONLINE_HOUR_RANGES = tuple(
+    (60, 150) if 18 <= hour <= 23 else
+    (20, 80) if 10 <= hour <= 17 else
+    (10, 40) if 7 <= hour <= 9 else
+    (0, 20)
+    for hour in range(24)
+)
+
+
+def generate_online_schedule(seed):
+    """Generate hourly online counts (simple math, no templates).
+
+    Each hour's bump is derived from a CRC32 of "<seed>-hour-<n>"; main()
+    passes the generation timestamp, so every run gets a fresh schedule
+    without seeding a PRNG. Keys are int hours; json.dump writes them as
+    the same "0".."23" strings.
+    """
     base = 45
-    for hour in range(24):
-        if 18 <= hour <= 23:
-            count = base + random.randint(60, 150)
-        elif 10 <= hour <= 17:
-            count = base + random.randint(20, 80)
-        elif 7 <= hour <= 9:
-            count = base + random.randint(10, 40)
+    return {hour: base + lo + zlib.crc32(f"{seed}-hour-{hour}".encode()) % (hi - lo + 1)
+            for hour, (lo, hi) in enumerate(ONLINE_HOUR_RANGES)}
+
+
+# ── Output ───────────────────────────────────────────────────────────────
+
+def write_stream(f, community):
+    """Write community as compact JSON bytes, one subtree at a time.
+
+    Output matches json.dump(community, f, separators=(",", ":")) but never
+    holds the whole document as a single string; players are written one
+    record at a time and comment threads per app. The encoder escapes
+    non-ASCII, so f is a binary file and each chunk is ASCII-encoded
+    directly. The data is a plain tree, so the encoder's circular-reference
+    bookkeeping is switched off.
+    """
+    encode = json.JSONEncoder(separators=(",", ":"), check_circular=False).encode
+
+    def dumps(value):
+        return encode(value).encode("ascii")
+
+    write = f.write
+    write(b"{")
+    for n, (key, value) in enumerate(community.items()):
+        if n:
+            write(b",")
+        write(dumps(key) + b":")
+        if key == "comments" and isinstance(value, dict):
+            write(b"{")
+            for m, (stem, thread) in enumerate(value.items()):
+                if m:
+                    write(b",")
+                write(dumps(stem) + b":" + dumps(thread))
+            write(b"}")
+        elif key == "players" and isinstance(value, list):
+            write(b"[")
+            for m, player in enumerate(value):
+                if m:
+                    write(b",")
+                write(dumps(player))
+            write(b"]")
         else:
-            count = base + random.randint(0, 20)
-        schedule[str(hour)] = count
-    return schedule
+            write(dumps(value))
+    write(b"}")
+
+
+# ── Input Fingerprint ────────────────────────────────────────────────────
+
+def compute_input_hash():
+    """SHA-256 over the raw manifest and rankings bytes."""
+    h = hashlib.sha256(MANIFEST.read_bytes())
+    if RANKINGS.exists():
+        h.update(RANKINGS.read_bytes())
+    return h.hexdigest()
+
+
+def load_previous_input_hash():
+    """Return meta.inputHash from the existing OUTPUT, or None."""
+    try:
+        with open(OUTPUT, "rb") as f:
+            return json.load(f).get("meta", {}).get("inputHash")
+    except (OSError, ValueError, AttributeError):
+        return None
 
 
 # ── Main Pipeline ────────────────────────────────────────────────────────
@@ -434,6 +671,12 @@ def main():
     global VERBOSE
     VERBOSE = "--verbose" in sys.argv
     push = "--push" in sys.argv
+    force = "--force" in sys.argv
+
+    input_hash = compute_input_hash()
+    if not force and load_previous_input_hash() == input_hash:
+        print(f"{OUTPUT.name} is up-to-date (inputs unchanged). Use --force to regenerate.")
+        return
 
     # Verify Copilot CLI is available
     backend = detect_backend()
@@ -453,15 +696,17 @@ def main():
     if RANKINGS.exists():
         with open(RANKINGS) as f:
             rankings_data = json.load(f)
+    rankings_by_file = index_rankings(rankings_data)
 
     # Collect all apps
     apps_list = []
     for cat_key, cat_data in manifest.get("categories", {}).items():
+        cat_title = cat_data.get("title", cat_key)
+        folder = cat_data.get("folder", cat_key)
         for app in cat_data.get("apps", []):
             apps_list.append({
                 "app": app, "catKey": cat_key,
-                "catTitle": cat_data.get("title", cat_key),
-                "folder": cat_data.get("folder", cat_key),
+                "catTitle": cat_title, "folder": folder,
             })
 
     print(f"  {len(apps_list)} apps to generate content for")
@@ -471,127 +716,45 @@ def main():
     players = generate_players_llm(250)
     print(f"  Created {len(players)} unique player profiles")
 
-    # ── Step 2: Generate comments (batched LLM calls) ──
-    print("\n[2/4] Generating comment threads...")
-    all_comments = {}
-    total_comments = 0
-    batch_size = 5
-
-    for i in range(0, len(apps_list), batch_size):
-        batch = apps_list[i:i + batch_size]
-        batch_num = i // batch_size + 1
-        total_batches = (len(apps_list) + batch_size - 1) // batch_size
-
-        vprint(f"  Batch {batch_num}/{total_batches} ({len(batch)} apps)...")
-
-        result = generate_comments_batch_llm(batch, players, rankings_data)
-
-        # Assemble results into comment objects
-        rng = random.Random(str(time.time()) + str(i))
-        for app_info in batch:
-            app = app_info["app"]
-            filename = app["file"]
-            stem = filename.replace(".html", "")
-            gen = app.get("generation", 0)
-
-            raw_comments = result.get(filename) or result.get(stem)
-            if raw_comments and isinstance(raw_comments, list):
-                # Build threaded comment objects
-                base_time = datetime.now() - timedelta(days=rng.randint(1, 60))
-                comments = []
-                top_level = []
-                sample = rng.sample(players, min(len(raw_comments) + 4, len(players)))
-                player_map = {p["username"]: p for p in sample}
-                pidx = 0
-
-                for j, item in enumerate(raw_comments):
-                    if not isinstance(item, dict):
-                        continue
-                    text = item.get("text", "")
-                    if not text:
-                        continue
-                    author = item.get("author", "")
-                    reply_to = item.get("reply_to")
-                    is_mod = "ArcadeKeeper" in author or item.get("is_mod")
-
-                    player = player_map.get(author)
-                    if not player and not is_mod:
-                        if pidx < len(sample):
-                            player = sample[pidx]
-                            pidx += 1
-                        else:
-                            player = rng.choice(players)
-
-                    ct = base_time + timedelta(hours=rng.randint(0, 48 * (j + 1)))
-                    comment = {
-                        "id": "c" + hashlib.md5(f"{filename}-{j}-{time.time()}".encode()).hexdigest()[:8],
-                        "author": "ArcadeKeeper" if is_mod else (player["username"] if player else author),
-                        "authorId": "mod-001" if is_mod else (player["id"] if player else "p0000"),
-                        "authorColor": "#ff4500" if is_mod else (player["color"] if player else "#888"),
-                        "text": text,
-                        "timestamp": ct.isoformat(),
-                        "upvotes": rng.randint(1, 50),
-                        "downvotes": rng.randint(0, 5),
-                        "version": max(1, gen) if gen > 0 else 1,
-                        "parentId": None,
-                        "children": [],
-                    }
-                    if is_mod:
-                        comment["isModerator"] = True
-
-                    if reply_to is not None and isinstance(reply_to, int) and 0 <= reply_to < len(top_level):
-                        parent = top_level[reply_to]
-                        comment["parentId"] = parent["id"]
-                        comment["upvotes"] = rng.randint(1, 20)
-                        parent["children"].append(comment)
-                    else:
-                        comments.append(comment)
-                        top_level.append(comment)
-
-                all_comments[stem] = comments
-                total_comments += len(comments) + sum(
-                    len(c.get("children", [])) for c in comments)
-            else:
-                # Single-app fallback
-                single = generate_comments_for_app_llm(
-                    app, app_info["catKey"], app_info["catTitle"],
-                    players, rankings_data
-                )
-                if single:
-                    all_comments[stem] = single
-                    total_comments += len(single)
-
-        time.sleep(1)  # Rate limit between batches
-
-        if (batch_num) % 10 == 0:
-            print(f"  [{i + len(batch)}/{len(apps_list)}] {total_comments} comments so far...")
-
-    print(f"  Generated {total_comments} unique comments across {len(all_comments)} apps")
-
-    # ── Step 3: Generate ratings ──
-    print("\n[3/4] Generating ratings...")
-    ratings = generate_ratings(apps_list, rankings_data)
-    total_ratings = sum(len(v) for v in ratings.values())
-    print(f"  Generated {total_ratings} ratings")
-
-    # ── Step 4: Generate activity feed ──
-    print("\n[4/4] Generating activity feed...")
-    activity = generate_activity_llm(apps_list, players, count=150)
+    # Ratings and the activity feed only depend on players, so run them in
+    # the background while the (much longer) comment batches run here.
+    with ThreadPoolExecutor(max_workers=2) as background:
+        ratings_future = background.submit(generate_ratings, apps_list, rankings_by_file)
+        activity_future = background.submit(
+            generate_activity_llm, apps_list, players, count=150)
+
+        # ── Step 2: Generate comments (batched LLM calls) ──
+        print("\n[2/4] Generating comment threads...")
+        all_comments, total_comments = generate_all_comments(
+            apps_list, players, rankings_by_file)
+        print(f"  Generated {total_comments} unique comments across {len(all_comments)} apps")
+
+        # ── Step 3: Generate ratings ──
+        print("\n[3/4] Generating ratings...")
+        ratings = ratings_future.result()
+        total_ratings = sum(len(v) for v in ratings.values())
+        print(f"  Generated {total_ratings} ratings")
+
+        # ── Step 4: Generate activity feed ──
+        print("\n[4/4] Generating activity feed...")
+        activity = activity_future.result()
     print(f"  Generated {len(activity)} activity events")
 
-    online_schedule = generate_online_schedule()
+    generated = datetime.now(timezone.utc).isoformat(timespec="seconds")
+    online_schedule = generate_online_schedule(generated)
 
     # ── Write output ──
     community = {
         "meta": {
-            "generated": datetime.now().isoformat(),
+            "generated": generated,
             "version": "2.0",
             "engine": f"copilot-cli/{MODEL}",
             "totalPlayers": len(players),
             "totalComments": total_comments,
             "totalRatings": total_ratings,
             "totalApps": len(apps_list),
-            "note": "100% dynamically generated. Zero templates. Zero cache. Every run unique.",
+            "inputHash": input_hash,
+            "note": "100% dynamically generated. Zero templates. Regenerated only when inputs change.",
         },
         "players": players,
         "comments": all_comments,
@@ -600,13 +763,13 @@ def main():
         "onlineSchedule": online_schedule,
     }
 
-    with open(OUTPUT, "w") as f:
-        json.dump(community, f, separators=(",", ":"))
+    with open(OUTPUT, "wb", buffering=1 << 20) as f:
+        write_stream(f, community)
 
     size_kb = OUTPUT.stat().st_size / 1024
     print(f"\nWrote {OUTPUT} ({size_kb:.0f} KB)")
     print(f"  {len(players)} players, {total_comments} comments, {total_ratings} ratings")
-    print(f"  Engine: {MODEL} — zero templates, zero cache, 100% fresh")
+    print(f"  Engine: {MODEL} — zero templates, 100% fresh")
 
     if push:
         import subprocess
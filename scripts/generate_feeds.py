@@ -11,9 +11,11 @@ Usage:
 
 import json
 import os
+import stat
 import sys
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from xml.sax.saxutils import escape as xml_escape
 
 SITE_URL = "https://kody-w.github.io/localFirstTools-main"
 MANIFEST_PATH = os.path.join(os.path.dirname(__file__), "..", "apps", "manifest.json")
@@ -35,9 +37,17 @@ COMPLEXITY_MAP = {
     "advanced": "Advanced",
 }
 
+# Same escaping as xml.sax.saxutils.escape, done in one C-level translate pass
+XML_ESCAPE_TABLE = str.maketrans({"&": "&amp;", "<": "&lt;", ">": "&gt;"})
+
+
+def xml_escape(text):
+    """Escape &, < and > for XML character data."""
+    return text.translate(XML_ESCAPE_TABLE)
+
 
 def load_json(path):
-    with open(path, "r") as f:
+    with open(path, "rb") as f:
         return json.load(f)
 
 
@@ -49,66 +59,83 @@ def load_rankings(path):
     return data if isinstance(data, list) else []
 
 
-def build_feed_json(manifest, rankings):
-    """Build Schema.org DataFeed JSON-LD."""
-    scores = {}
-    if rankings:
-        for entry in rankings:
-            scores[entry.get("file", "")] = entry.get("score", 0)
+def build_scores(rankings):
+    """Map app filename -> quality score, shared by both feed builders."""
+    return {entry.get("file", ""): entry.get("score", 0) for entry in rankings or ()}
 
-    items = []
+
+def _iter_apps(manifest):
+    """Yield (cat_key, url_prefix, cat_title, app) for every app in the manifest.
+
+    Per-category values are resolved once per category rather than per app.
+    """
     for cat_key, cat in manifest.get("categories", {}).items():
         folder = cat.get("folder", cat_key.replace("_", "-"))
+        url_prefix = f"{SITE_URL}/apps/{folder}/"
+        cat_title = cat.get("title", cat_key)
         for app in cat.get("apps", []):
-            app_url = "{}/apps/{}/{}".format(SITE_URL, folder, app["file"])
-            schema_type = SCHEMA_TYPE_MAP.get(app.get("type", ""), "WebApplication")
-
-            item = {
-                "@type": "DataFeedItem",
-                "dateModified": app.get("created", "2024-01-01"),
-                "item": {
-                    "@type": schema_type,
-                    "name": app.get("title", app["file"]),
-                    "description": app.get("description", ""),
-                    "url": app_url,
-                    "applicationCategory": cat.get("title", cat_key),
-                    "operatingSystem": "Any (browser)",
-                    "offers": {
-                        "@type": "Offer",
-                        "price": "0",
-                        "priceCurrency": "USD",
-                    },
-                    "isAccessibleForFree": True,
-                    "inLanguage": "en",
-                },
+            yield cat_key, url_prefix, cat_title, app
+
+
+def _iter_feed_items(manifest, scores):
+    """Yield one Schema.org DataFeedItem per app."""
+    schema_type_for = SCHEMA_TYPE_MAP.get
+    score_for = scores.get
+    for cat_key, url_prefix, cat_title, app in _iter_apps(manifest):
+        get = app.get
+        filename = app["file"]
+        app_url = url_prefix + filename
+        schema_type = schema_type_for(get("type", ""), "WebApplication")
+
+        inner = {
+            "@type": schema_type,
+            "name": get("title", filename),
+            "description": get("description", ""),
+            "url": app_url,
+            "applicationCategory": cat_title,
+            "operatingSystem": "Any (browser)",
+            "offers": {
+                "@type": "Offer",
+                "price": "0",
+                "priceCurrency": "USD",
+            },
+            "isAccessibleForFree": True,
+            "inLanguage": "en",
+        }
+
+        tags = get("tags")
+        if tags:
+            inner["keywords"] = ", ".join(tags)
+        complexity = get("complexity")
+        if complexity:
+            inner["proficiencyLevel"] = COMPLEXITY_MAP.get(complexity, complexity)
+        if get("featured"):
+            inner["isFamilyFriendly"] = True
+
+        score = score_for(filename, 0)
+        if score:
+            inner["aggregateRating"] = {
+                "@type": "AggregateRating",
+                "ratingValue": round(score, 1),
+                "bestRating": 100,
+                "worstRating": 0,
+                "ratingCount": 1,
             }
 
-            if app.get("tags"):
-                item["item"]["keywords"] = ", ".join(app["tags"])
-            if app.get("complexity"):
-                item["item"]["proficiencyLevel"] = COMPLEXITY_MAP.get(
-                    app["complexity"], app["complexity"]
-                )
-            if app.get("featured"):
-                item["item"]["isFamilyFriendly"] = True
-
-            score = scores.get(app["file"], 0)
-            if score:
-                item["item"]["aggregateRating"] = {
-                    "@type": "AggregateRating",
-                    "ratingValue": round(score, 1),
-                    "bestRating": 100,
-                    "worstRating": 0,
-                    "ratingCount": 1,
-                }
-
-            gen = app.get("generation", 0)
-            if gen:
-                item["item"]["version"] = "gen-{}".format(gen)
-
-            items.append(item)
-
-    feed = {
+        gen = get("generation", 0)
+        if gen:
+            inner["version"] = f"gen-{gen}"
+
+        yield {
+            "@type": "DataFeedItem",
+            "dateModified": get("created", "2024-01-01"),
+            "item": inner,
+        }
+
+
+def _feed_json_header():
+    """DataFeed fields that precede dataFeedElement."""
+    return {
         "@context": "https://schema.org",
         "@type": "DataFeed",
         "name": "RappterZoo App Feed",
@@ -121,56 +148,82 @@ def build_feed_json(manifest, rankings):
         },
         "dateModified": datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%SZ"),
         "license": "https://opensource.org/licenses/MIT",
-        "dataFeedElement": items,
     }
-    return feed
 
 
-def build_feed_xml(manifest, rankings):
-    """Build RSS 2.0 XML feed."""
-    scores = {}
-    if rankings:
-        for entry in rankings:
-            scores[entry.get("file", "")] = entry.get("score", 0)
+def build_feed_json(manifest, scores):
+    """Build Schema.org DataFeed JSON-LD."""
+    feed = _feed_json_header()
+    feed["dataFeedElement"] = list(_iter_feed_items(manifest, scores))
+    return feed
+
 
+def write_feed_json(path, manifest, scores):
+    """Stream the DataFeed to path one item at a time; returns the item count.
+
+    Output is identical to json.dumps(build_feed_json(...), indent=2), but
+    the item list is never materialized. Written via a temp file and
+    os.replace so readers never see a partial feed.
+    """
+    head = json.dumps(_feed_json_header(), indent=2)[:-2]  # drop closing "\n}"
+    count = 0
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w") as f:
+            write = f.write
+            dumps = json.dumps
+            write(head + ',\n  "dataFeedElement": [')
+            for item in _iter_feed_items(manifest, scores):
+                write((",\n    " if count else "\n    ")
+                      + dumps(item, indent=2).replace("\n", "\n    "))
+                count += 1
+            write("\n  ]\n}" if count else "]\n}")
+        # mkstemp creates 0600; keep the feed's existing mode (or 0644)
+        try:
+            mode = stat.S_IMODE(os.stat(path).st_mode)
+        except FileNotFoundError:
+            mode = 0o644
+        os.chmod(tmp, mode)
+        os.replace(tmp, path)
+    except Exception:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+    return count
+
+
+def build_feed_xml(manifest, scores):
+    """Build RSS 2.0 XML feed as UTF-8 bytes, matching its XML declaration."""
+    # Locals for the per-app loop: avoids a global/attribute lookup per call
+    esc = xml_escape
+    score_for = scores.get
     items_xml = []
-    for cat_key, cat in manifest.get("categories", {}).items():
-        folder = cat.get("folder", cat_key.replace("_", "-"))
-        for app in cat.get("apps", []):
-            app_url = "{}/apps/{}/{}".format(SITE_URL, folder, app["file"])
-            title = app.get("title", app["file"])
-            desc = app.get("description", "")
-            created = app.get("created", "2024-01-01")
-            tags = app.get("tags", [])
-            score = scores.get(app["file"], 0)
-
-            categories_xml = ""
-            for tag in tags:
-                categories_xml += "      <category>{}</category>\n".format(
-                    xml_escape(tag)
-                )
-            categories_xml += "      <category>{}</category>\n".format(
-                xml_escape(cat.get("title", cat_key))
-            )
-
-            score_note = " (score: {}/100)".format(round(score)) if score else ""
-
-            items_xml.append(
-                """    <item>
-      <title>{title}</title>
+    add_item = items_xml.append
+    for cat_key, url_prefix, cat_title, app in _iter_apps(manifest):
+        get = app.get
+        filename = app["file"]
+        url = esc(url_prefix + filename)
+        title = get("title", filename)
+        desc = get("description", "")
+        created = get("created", "2024-01-01")
+        tags = get("tags", [])
+        score = score_for(filename, 0)
+
+        cat_parts = [f"      <category>{esc(tag)}</category>\n" for tag in tags]
+        cat_parts.append(f"      <category>{esc(cat_title)}</category>\n")
+        categories_xml = "".join(cat_parts)
+
+        score_note = f" (score: {round(score)}/100)" if score else ""
+
+        add_item(f"""    <item>
+      <title>{esc(title)}</title>
       <link>{url}</link>
-      <description>{desc}{score}</description>
+      <description>{esc(desc)}{score_note}</description>
       <guid isPermaLink="true">{url}</guid>
-      <pubDate>{date}</pubDate>
-{categories}    </item>""".format(
-                    title=xml_escape(title),
-                    url=xml_escape(app_url),
-                    desc=xml_escape(desc),
-                    score=xml_escape(score_note),
-                    date=xml_escape(created),
-                    categories=categories_xml,
-                )
-            )
+      <pubDate>{esc(created)}</pubDate>
+{categories_xml}    </item>""")
 
     rss = """<?xml version="1.0" encoding="UTF-8"?>
 <rss version="2.0" xmlns:atom="http://www.w3.org/2005/Atom">
@@ -190,7 +243,14 @@ def build_feed_xml(manifest, rankings):
         now=datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%SZ"),
         items="\n".join(items_xml),
     )
-    return rss
+    return rss.encode("utf-8")
+
+
+def write_feed_xml(path, manifest, scores):
+    """Build the RSS feed and write it to path."""
+    feed_xml = build_feed_xml(manifest, scores)
+    with open(path, "wb") as f:
+        f.write(feed_xml)
 
 
 def main():
@@ -207,26 +267,21 @@ def main():
             if verbose:
                 print("  Warning: could not load rankings.json")
 
+    scores = build_scores(rankings)
+
     # Count apps
-    total = sum(
-        len(c.get("apps", []))
-        for c in manifest.get("categories", {}).values()
-    )
+    total = sum(1 for _ in _iter_apps(manifest))
 
-    # Generate JSON-LD feed
-    feed_json = build_feed_json(manifest, rankings)
+    # Generate JSON-LD and RSS feeds concurrently; both only read manifest/scores
     json_path = os.path.abspath(FEED_JSON_PATH)
-    with open(json_path, "w") as f:
-        json.dump(feed_json, f, indent=2)
-    if verbose:
-        print("  Wrote {} ({} items)".format(json_path, len(feed_json["dataFeedElement"])))
-
-    # Generate RSS feed
-    feed_xml = build_feed_xml(manifest, rankings)
     xml_path = os.path.abspath(FEED_XML_PATH)
-    with open(xml_path, "w") as f:
-        f.write(feed_xml)
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        json_future = executor.submit(write_feed_json, json_path, manifest, scores)
+        xml_future = executor.submit(write_feed_xml, xml_path, manifest, scores)
+        item_count = json_future.result()
+        xml_future.result()
     if verbose:
+        print("  Wrote {} ({} items)".format(json_path, item_count))
         print("  Wrote {}".format(xml_path))
 
     print("Generated feeds: {} apps -> feed.json + feed.xml".format(total))
@@ -2,31 +2,58 @@
 """Shared agent memory store for RappterZoo.
 
 Provides atomic read/write for per-agent memory files and a cross-agent
-relationship ledger. All files live in .claude/memory/.
+relationship ledger. All files live in .claude/memory/. The ledger is a
+ledger.json snapshot plus an append-only ledger.jsonl log, compacted
+periodically.
 
 Usage:
     from scripts.memory import (
         load_agent_memory, save_agent_memory, append_memory_entry,
-        load_ledger, append_relationship, find_relationships,
+        append_memory_entries, agent_memory_session,
+        load_ledger, append_relationship, compact_ledger, find_relationships,
         get_all_entries_for_target
     )
+
+Agents recording several entries in one pass should prefer
+append_memory_entries or agent_memory_session, which write the file once.
 """
 
+import bisect
+import contextlib
+import copy
 import hashlib
 import json
 import os
 import tempfile
-import uuid
 from datetime import datetime, timezone
 from pathlib import Path
+from typing import Optional
 
 ROOT = Path(__file__).resolve().parent.parent
 MEMORY_DIR = ROOT / ".claude" / "memory"
 LEDGER_PATH = MEMORY_DIR / "ledger.json"
 
-VALID_ENTRY_TYPES = {"created", "molted", "scored", "audited", "linked", "note"}
-VALID_RELATIONS = {"teaches", "improves", "duplicates", "relates_to", "derived_from", "competes_with"}
-KNOWN_AGENTS = {"molter-engine", "game-factory", "data-slosh", "task-delegator"}
+VALID_ENTRY_TYPES = frozenset({"created", "molted", "scored", "audited", "linked", "note"})
+VALID_RELATIONS = frozenset({"teaches", "improves", "duplicates", "relates_to", "derived_from", "competes_with"})
+KNOWN_AGENTS = frozenset({"molter-engine", "game-factory", "data-slosh", "task-delegator"})
+UTC = timezone.utc
+
+# Not agent memory files. _target_index.json was an on-disk index written by
+# older versions; a leftover copy must not be read as an agent.
+NON_AGENT_FILES = frozenset({"schema.json", "ledger.json", "_target_index.json"})
+
+# Relationship appends go to ledger.jsonl and are folded into ledger.json
+# once the log holds this many lines
+LEDGER_COMPACT_AFTER = 500
+
+
+def _new_id() -> str:
+    """Random RFC 4122 version-4 UUID string, formatted without uuid.UUID."""
+    b = bytearray(os.urandom(16))
+    b[6] = (b[6] & 0x0F) | 0x40
+    b[8] = (b[8] & 0x3F) | 0x80
+    h = b.hex()
+    return f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}"
 
 
 def _atomic_write(path: Path, data: dict) -> None:
@@ -35,8 +62,7 @@ def _atomic_write(path: Path, data: dict) -> None:
     fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
     try:
         with os.fdopen(fd, "w") as f:
-            json.dump(data, f, indent=2)
-            f.write("\n")
+            f.write(json.dumps(data, indent=2) + "\n")
         os.replace(tmp, path)
     except Exception:
         try:
@@ -50,55 +76,205 @@ def load_agent_memory(name: str) -> dict:
     """Load an agent's memory file. Returns empty structure if missing."""
     path = MEMORY_DIR / f"{name}.json"
     if path.exists():
-        return json.loads(path.read_text())
-    return {"agent": name, "lastUpdated": datetime.now(timezone.utc).isoformat(), "entries": []}
+        return json.loads(path.read_bytes())
+    return {"agent": name, "lastUpdated": datetime.now(UTC).isoformat(), "entries": []}
+
 
+def save_agent_memory(name: str, data: dict, *, now_iso: Optional[str] = None) -> None:
+    """Atomically save an agent's memory file.
 
-def save_agent_memory(name: str, data: dict) -> None:
-    """Atomically save an agent's memory file."""
-    data["lastUpdated"] = datetime.now(timezone.utc).isoformat()
+    ``now_iso`` lets callers that already formatted a timestamp reuse it
+    for ``lastUpdated``.
+    """
+    data["lastUpdated"] = now_iso or datetime.now(UTC).isoformat()
     _atomic_write(MEMORY_DIR / f"{name}.json", data)
 
 
-def append_memory_entry(name: str, entry: dict) -> dict:
-    """Append an entry to an agent's memory. Returns the entry with id/timestamp filled."""
+def _prepare_entry(entry: dict, now_iso: str) -> dict:
+    """Fill in id/timestamp and validate the entry type."""
     if "id" not in entry:
-        entry["id"] = str(uuid.uuid4())
+        entry["id"] = _new_id()
     if "timestamp" not in entry:
-        entry["timestamp"] = datetime.now(timezone.utc).isoformat()
+        entry["timestamp"] = now_iso
     if entry.get("type") not in VALID_ENTRY_TYPES:
         raise ValueError(f"Invalid entry type: {entry.get('type')}. Must be one of {VALID_ENTRY_TYPES}")
-    mem = load_agent_memory(name)
-    mem["entries"].append(entry)
-    save_agent_memory(name, mem)
     return entry
 
 
+def append_memory_entry(name: str, entry: dict) -> dict:
+    """Append an entry to an agent's memory. Returns the entry with id/timestamp filled.
+
+    Each call rewrites the memory file; use append_memory_entries or
+    agent_memory_session when recording several entries in one pass.
+    """
+    return append_memory_entries(name, [entry])[0]
+
+
+def append_memory_entries(name: str, entries: list) -> list:
+    """Append several entries with a single load and atomic save.
+
+    All entries are validated before anything is written.
+    """
+    now = datetime.now(UTC).isoformat()
+    entries = [_prepare_entry(e, now) for e in entries]
+    mem = load_agent_memory(name)
+    mem["entries"].extend(entries)
+    save_agent_memory(name, mem, now_iso=now)
+    return entries
+
+
+@contextlib.contextmanager
+def agent_memory_session(name: str):
+    """Yield an agent's memory dict for batched edits, saved once on exit.
+
+    Entries appended to ``mem["entries"]`` inside the block get id/timestamp
+    filled and are validated on exit. Nothing is written if the block raises.
+    """
+    mem = load_agent_memory(name)
+    start = len(mem["entries"])
+    yield mem
+    now = datetime.now(UTC).isoformat()
+    for entry in mem["entries"][start:]:
+        _prepare_entry(entry, now)
+    save_agent_memory(name, mem, now_iso=now)
+
+
+def _hash_ids(ids) -> str:
+    """128-bit BLAKE2b digest of already-sorted relationship IDs."""
+    return hashlib.blake2b("|".join(ids).encode(), digest_size=16).hexdigest()
+
+
 def _compute_consistency_hash(relationships: list) -> str:
-    """MD5 hash of sorted relationship IDs for integrity checking."""
-    ids = sorted(r["id"] for r in relationships)
-    return hashlib.md5("|".join(ids).encode()).hexdigest()
+    """Hash of sorted relationship IDs for integrity checking."""
+    return _hash_ids(sorted(r["id"] for r in relationships))
+
+
+# Process-local ledger cache: (path, signatures, ledger, sorted ids, log lines).
+# The signatures of the snapshot and the append log change whenever either
+# file is written, so edits made by other processes are picked up on the
+# next call.
+_ledger_cache = None
+
+
+def _file_signature(path: Path):
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        return None
+    return (st.st_ino, st.st_mtime_ns, st.st_size)
+
+
+def _ledger_log_path() -> Path:
+    """Append-only JSONL log of relationships added since the last compaction."""
+    return LEDGER_PATH.with_suffix(".jsonl")
+
+
+def _ledger_signature():
+    return (_file_signature(LEDGER_PATH), _file_signature(_ledger_log_path()))
+
+
+def _cached_ledger():
+    """Return the cache tuple for the ledger, re-reading it only if it changed.
+
+    The ledger is the ledger.json snapshot plus every relationship in the
+    ledger.jsonl append log. Log lines whose id is already present (left
+    over from an interrupted compaction) and a torn final line are skipped.
+    """
+    global _ledger_cache
+    sig = _ledger_signature()
+    if _ledger_cache and _ledger_cache[0] == LEDGER_PATH and _ledger_cache[1] == sig:
+        return _ledger_cache
+    if sig[0] is not None:
+        ledger = json.loads(LEDGER_PATH.read_bytes())
+    else:
+        ledger = {"relationships": [], "consistencyHash": _hash_ids(())}
+    pending = 0
+    if sig[1] is not None:
+        rels = ledger["relationships"]
+        seen = {r["id"] for r in rels}
+        with open(_ledger_log_path(), "rb") as f:
+            for line in f:
+                try:
+                    rel = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                pending += 1
+                if rel["id"] not in seen:
+                    seen.add(rel["id"])
+                    rels.append(rel)
+    ids = sorted(r["id"] for r in ledger["relationships"])
+    ledger["consistencyHash"] = _hash_ids(ids)
+    _ledger_cache = (LEDGER_PATH, sig, ledger, ids, pending)
+    return _ledger_cache
 
 
 def load_ledger() -> dict:
     """Load the cross-agent relationship ledger."""
-    if LEDGER_PATH.exists():
-        return json.loads(LEDGER_PATH.read_text())
-    return {"relationships": [], "consistencyHash": hashlib.md5(b"").hexdigest()}
+    ledger = _cached_ledger()[2]
+    return {**ledger, "relationships": [dict(r) for r in ledger["relationships"]]}
+
+
+def compact_ledger() -> dict:
+    """Fold the append log into the ledger.json snapshot and remove the log."""
+    global _ledger_cache
+    _, _, ledger, ids, _ = _cached_ledger()
+    _atomic_write(LEDGER_PATH, ledger)
+    try:
+        _ledger_log_path().unlink()
+    except FileNotFoundError:
+        pass
+    _ledger_cache = (LEDGER_PATH, _ledger_signature(), ledger, ids, 0)
+    return load_ledger()
 
 
 def append_relationship(rel: dict) -> dict:
-    """Append a relationship to the ledger. Returns the relationship with id/timestamp filled."""
+    """Append a relationship to the ledger. Returns the relationship with id/timestamp filled.
+
+    Writes a single line to the ledger.jsonl append log instead of
+    rewriting the whole ledger; the log is folded into ledger.json once it
+    reaches LEDGER_COMPACT_AFTER lines.
+    """
+    global _ledger_cache
     if "id" not in rel:
-        rel["id"] = str(uuid.uuid4())
+        rel["id"] = _new_id()
     if "timestamp" not in rel:
-        rel["timestamp"] = datetime.now(timezone.utc).isoformat()
+        rel["timestamp"] = datetime.now(UTC).isoformat()
     if rel.get("relation") not in VALID_RELATIONS:
         raise ValueError(f"Invalid relation: {rel.get('relation')}. Must be one of {VALID_RELATIONS}")
-    ledger = load_ledger()
-    ledger["relationships"].append(rel)
-    ledger["consistencyHash"] = _compute_consistency_hash(ledger["relationships"])
-    _atomic_write(LEDGER_PATH, ledger)
+    _, (snapshot_sig, log_sig), ledger, ids, pending = _cached_ledger()
+    line = json.dumps(rel).encode() + b"\n"
+    try:
+        with open(_ledger_log_path(), "a+b") as f:
+            # Another process may have appended or compacted since the cache
+            # was read; the cache then cannot be extended in place
+            end = f.seek(0, os.SEEK_END)
+            in_sync = (end == (log_sig[2] if log_sig else 0)
+                       and _file_signature(LEDGER_PATH) == snapshot_sig)
+            # Start on a fresh line if the log ends in a torn write, so this
+            # entry is not glued onto the unparseable tail
+            if end:
+                f.seek(-1, os.SEEK_END)
+                if f.read(1) != b"\n":
+                    line = b"\n" + line
+            f.write(line)
+            f.flush()
+            st = os.fstat(f.fileno())
+    except Exception:
+        _ledger_cache = None
+        raise
+    if not in_sync or st.st_size != end + len(line):
+        # Re-read both files on the next call instead of trusting the cache
+        _ledger_cache = None
+        pending = _cached_ledger()[4]
+    else:
+        ledger["relationships"].append(rel)
+        bisect.insort(ids, rel["id"])
+        ledger["consistencyHash"] = _hash_ids(ids)
+        pending += 1
+        log_sig = (st.st_ino, st.st_mtime_ns, st.st_size)
+        _ledger_cache = (LEDGER_PATH, (snapshot_sig, log_sig), ledger, ids, pending)
+    if pending >= LEDGER_COMPACT_AFTER:
+        compact_ledger()
     return rel
 
 
@@ -108,17 +284,61 @@ def find_relationships(target: str) -> list:
     return [r for r in ledger["relationships"] if r.get("source") == target or r.get("target") == target]
 
 
+# Process-local target index: (memory dir, {file name: slot}). Each slot
+# holds the file's signature and its entries grouped by target, so only
+# files written since the last lookup (by any process, through any code
+# path) are parsed again.
+_target_index = None
+
+
+def _index_memory_file(path: Path, sig) -> dict:
+    """Parse one agent file into its target-index slot."""
+    data = json.loads(path.read_bytes())
+    agent = data.get("agent", path.stem)
+    by_target = {}
+    for entry in data.get("entries", []):
+        target = entry.get("target")
+        if target is not None:
+            by_target.setdefault(target, []).append({**entry, "_agent": agent})
+    return {"sig": sig, "targets": by_target}
+
+
+def _load_target_index() -> dict:
+    """Return the target index, re-indexing only agent files that changed.
+
+    A lookup costs one stat per agent file and a parse only for files whose
+    inode/mtime/size signature differs from the cached slot.
+    """
+    global _target_index
+    files = _target_index[1] if _target_index and _target_index[0] == MEMORY_DIR else {}
+    fresh = {}
+    for path in MEMORY_DIR.glob("*.json"):
+        if path.name in NON_AGENT_FILES:
+            continue
+        sig = _file_signature(path)
+        slot = files.get(path.name)
+        if slot is None or slot["sig"] != sig:
+            try:
+                slot = _index_memory_file(path, sig)
+            except (OSError, json.JSONDecodeError, KeyError):
+                continue
+        fresh[path.name] = slot
+    _target_index = (MEMORY_DIR, fresh)
+    return {"files": fresh}
+
+
+def rebuild_target_index() -> dict:
+    """Discard and rebuild the target index from every agent memory file."""
+    global _target_index
+    _target_index = None
+    return _load_target_index()
+
+
 def get_all_entries_for_target(target: str) -> list:
     """Query all agent memories for entries referencing a target."""
     results = []
-    for path in MEMORY_DIR.glob("*.json"):
-        if path.name in ("schema.json", "ledger.json"):
-            continue
-        try:
-            data = json.loads(path.read_text())
-            for entry in data.get("entries", []):
-                if entry.get("target") == target:
-                    results.append({**entry, "_agent": data.get("agent", path.stem)})
-        except (json.JSONDecodeError, KeyError):
-            continue
+    for slot in _load_target_index()["files"].values():
+        # Copies (entries nest a data dict), so callers editing results
+        # cannot reach the shared index
+        results.extend(copy.deepcopy(slot["targets"].get(target, [])))
     return sorted(results, key=lambda e: e.get("timestamp", ""))
@@ -15,10 +15,10 @@ import json
 import os
 import re
 import shutil
-import subprocess
 import sys
 from pathlib import Path
-from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
 
 REPO_ROOT = Path(__file__).resolve().parent.parent
 APPS_DIR = REPO_ROOT / "apps"
@@ -28,9 +28,10 @@ MANIFEST_PATH = APPS_DIR / "manifest.json"
 # CLASSIFICATION MAP
 # Each entry: filename -> target_category_key
 # Files NOT listed here STAY in experimental_ai
+# Read-only view: the plan is fixed data and must not change mid-run
 # ============================================================================
 
-MIGRATIONS = {
+MIGRATIONS = MappingProxyType({
     # ── creative-tools (utilities, productivity, enterprise, editors) ──────
     "unit-converter-suite.html": "creative_tools",
     "lorem-ipsum-generator.html": "creative_tools",
@@ -240,7 +241,21 @@ MIGRATIONS = {
     "picasso-bowl.html": "visual_art",
     "procedural-spider-ik.html": "visual_art",
     "crowd-heatmap.html": "visual_art",
-}
+})
+
+
+def _group_by_dest(migrations):
+    grouped = {}
+    for filename, dest_cat in migrations.items():
+        grouped.setdefault(dest_cat, []).append(filename)
+    return MappingProxyType({cat: tuple(files) for cat, files in grouped.items()})
+
+
+# Destination category -> filenames, in MIGRATIONS order; built once at import
+MIGRATIONS_BY_DEST = _group_by_dest(MIGRATIONS)
+
+# Concurrent file moves during --execute
+MOVE_WORKERS = 8
 
 # Category key -> folder name mapping
 CATEGORY_FOLDERS = {
@@ -256,31 +271,100 @@ CATEGORY_FOLDERS = {
 }
 
 
+# Literal probe: a plain substring scan is far cheaper than a regex miss
+META_CATEGORY_NAME = "rappterzoo:category"
+
+# rappterzoo:category meta tag with either quote style (name and content
+# must use the same one); group 2 is the quote character
+META_CATEGORY_RE = re.compile(
+    r"""(<meta\s+name=(["'])rappterzoo:category\2\s+content=\2)(?:(?<=")[^"]*|(?<=')[^']*)(\2)"""
+)
+
+
 def update_meta_category(html_content: str, new_category_key: str) -> str:
     """Update the rappterzoo:category meta tag in HTML content."""
-    # Try both formats: experimental_ai and experimental-ai
-    patterns = [
-        r'(<meta\s+name="rappterzoo:category"\s+content=")[^"]*(")',
-        r"(<meta\s+name='rappterzoo:category'\s+content=')[^']*(')",
-    ]
+    # One scan covers both formats; a file without the tag comes back unchanged
+    if META_CATEGORY_NAME not in html_content:
+        return html_content
     new_folder = CATEGORY_FOLDERS[new_category_key]
-    for pat in patterns:
-        if re.search(pat, html_content):
-            html_content = re.sub(pat, rf'\g<1>{new_folder}\2', html_content)
-            return html_content
-    # Tag doesn't exist; don't add one
-    return html_content
+    return META_CATEGORY_RE.sub(rf"\g<1>{new_folder}\3", html_content)
+
+
+# The tag sits in <head>; only this many leading bytes are searched before
+# falling back to the whole file
+HEAD_WINDOW = 8192
+META_CATEGORY_BYTES_RE = re.compile(META_CATEGORY_RE.pattern.encode())
+META_CATEGORY_NAME_BYTES = META_CATEGORY_NAME.encode()
+
+
+def copy_with_meta_category(src_path: Path, dest_path: Path, new_category_key: str) -> None:
+    """Copy an app to dest_path with its rappterzoo:category tag updated.
+
+    Only the head window goes through the regex; the rest of the file is
+    streamed across as raw bytes.
+    """
+    repl = rb"\g<1>" + CATEGORY_FOLDERS[new_category_key].encode() + rb"\3"
+    with open(src_path, "rb") as src, open(dest_path, "wb") as dst:
+        head = src.read(HEAD_WINDOW)
+        patched, n = META_CATEGORY_BYTES_RE.subn(repl, head)
+        if n:
+            dst.write(patched)
+            shutil.copyfileobj(src, dst, 1 << 20)
+        else:
+            content = head + src.read()
+            if META_CATEGORY_NAME_BYTES in content:
+                content = META_CATEGORY_BYTES_RE.sub(repl, content)
+            dst.write(content)
+
+
+def move_with_meta_category(src_path: Path, dest_path: Path, new_category_key: str) -> None:
+    """Move an app to dest_path with its rappterzoo:category tag updated.
+
+    Within one filesystem the move is a rename, so untagged files are never
+    rewritten; tagged files are then rewritten through a temp file. If the
+    rewrite fails the rename is undone, leaving the app where it was.
+    Cross-device moves fall back to a copy.
+    """
+    try:
+        os.rename(src_path, dest_path)
+    except OSError:
+        try:
+            copy_with_meta_category(src_path, dest_path, new_category_key)
+        except BaseException:
+            dest_path.unlink(missing_ok=True)
+            raise
+        src_path.unlink()
+        return
+    tmp_path = dest_path.with_name(dest_path.name + ".tmp")
+    try:
+        with open(dest_path, "rb") as f:
+            head = f.read(HEAD_WINDOW)
+            if not META_CATEGORY_BYTES_RE.search(head) and (
+                    len(head) < HEAD_WINDOW or META_CATEGORY_NAME_BYTES not in f.read()):
+                return
+        copy_with_meta_category(dest_path, tmp_path, new_category_key)
+        os.replace(tmp_path, dest_path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        os.rename(dest_path, src_path)
+        raise
 
 
 def load_manifest():
-    with open(MANIFEST_PATH, "r", encoding="utf-8") as f:
-        return json.load(f)
+    # json.loads decodes UTF-8 bytes itself; no separate text decode pass
+    return json.loads(MANIFEST_PATH.read_bytes())
 
 
 def save_manifest(manifest):
-    with open(MANIFEST_PATH, "w", encoding="utf-8") as f:
-        json.dump(manifest, f, indent=2, ensure_ascii=False)
-        f.write("\n")
+    """Serialize in memory, then swap the file in atomically.
+
+    json.dumps raises before anything touches disk, and os.replace means
+    readers never see a truncated manifest, so no re-read is needed.
+    """
+    data = (json.dumps(manifest, indent=2, ensure_ascii=False) + "\n").encode("utf-8")
+    tmp_path = MANIFEST_PATH.with_name(MANIFEST_PATH.name + ".tmp")
+    tmp_path.write_bytes(data)
+    os.replace(tmp_path, MANIFEST_PATH)
 
 
 def validate_manifest(manifest):
@@ -312,25 +396,29 @@ def main():
     print()
 
     # Build index: filename -> manifest entry (for experimental_ai)
-    exp_entries = {}
-    for entry in exp_ai["apps"]:
-        exp_entries[entry["file"]] = entry
+    exp_entries = {entry["file"]: entry for entry in exp_ai["apps"]}
 
     # Tally by destination
-    dest_counts = defaultdict(list)
+    dest_counts = {}
     missing_files = []
     missing_entries = []
     skipped = []
 
-    for filename, dest_cat in MIGRATIONS.items():
-        src_path = APPS_DIR / "experimental-ai" / filename
-        if not src_path.exists():
-            missing_files.append(filename)
-            continue
-        if filename not in exp_entries:
-            missing_entries.append(filename)
-            # File exists but not in manifest - still move it
-        dest_counts[dest_cat].append(filename)
+    exp_dir = APPS_DIR / "experimental-ai"
+    with os.scandir(exp_dir) as it:
+        on_disk = {e.name for e in it}
+    for dest_cat, filenames in MIGRATIONS_BY_DEST.items():
+        present = []
+        for filename in filenames:
+            if filename not in on_disk:
+                missing_files.append(filename)
+                continue
+            if filename not in exp_entries:
+                missing_entries.append(filename)
+                # File exists but not in manifest - still move it
+            present.append(filename)
+        if present:
+            dest_counts[dest_cat] = present
 
     # Print plan
     print("MIGRATION PLAN")
@@ -362,12 +450,9 @@ def main():
         print()
 
     # Show what stays
-    staying_files = []
-    for filename in exp_entries:
-        if filename not in MIGRATIONS:
-            staying_files.append(filename)
+    staying_files = sorted(exp_entries.keys() - MIGRATIONS.keys())
     print(f"STAYING in experimental-ai ({len(staying_files)}):")
-    for f in sorted(staying_files):
+    for f in staying_files:
         entry = exp_entries[f]
         print(f"  ✓ {f:55s} - {entry.get('title', '?')}")
     print()
@@ -385,58 +470,71 @@ def main():
     moved = 0
     errors = []
 
-    for cat_key, filenames in dest_counts.items():
-        folder = CATEGORY_FOLDERS[cat_key]
-        dest_dir = APPS_DIR / folder
-
-        # Ensure destination directory exists
-        dest_dir.mkdir(parents=True, exist_ok=True)
-
-        for filename in filenames:
-            src_path = APPS_DIR / "experimental-ai" / filename
-            dest_path = dest_dir / filename
-
-            if dest_path.exists():
-                print(f"  ⚠ SKIP {filename} - already exists in {folder}/")
-                skipped.append(filename)
-                continue
-
-            try:
-                # 1. Read and update HTML meta tag
-                content = src_path.read_text(encoding="utf-8")
-                updated_content = update_meta_category(content, cat_key)
-
-                # 2. Write to new location with updated meta tag
-                dest_path.write_text(updated_content, encoding="utf-8")
+    # experimental_ai entries not yet moved; its apps list is filtered once
+    # after the loop instead of list.remove() per file
+    exp_remaining = dict(exp_entries)
+    moved_out = set()
+    # Files this run moved (both ends), so the commit stages only those
+    touched_paths = [MANIFEST_PATH]
 
-                # 3. Remove from old location
-                src_path.unlink()
-
-                # 4. Update manifest: remove from experimental_ai
-                entry = exp_entries.get(filename)
-                if entry and entry in manifest["categories"]["experimental_ai"]["apps"]:
-                    manifest["categories"]["experimental_ai"]["apps"].remove(entry)
-                    manifest["categories"]["experimental_ai"]["count"] = len(
-                        manifest["categories"]["experimental_ai"]["apps"]
-                    )
-
-                    # 5. Add to destination category
-                    if cat_key not in manifest["categories"]:
-                        print(f"  ⚠ Category {cat_key} not in manifest!")
-                        errors.append(f"Missing category: {cat_key}")
-                        continue
-
-                    manifest["categories"][cat_key]["apps"].append(entry)
-                    manifest["categories"][cat_key]["count"] = len(
-                        manifest["categories"][cat_key]["apps"]
-                    )
-
-                moved += 1
-                print(f"  [{moved:3d}/{total_moving}] {filename:55s} → {folder}/")
-
-            except Exception as e:
-                errors.append(f"{filename}: {e}")
-                print(f"  ✗ ERROR {filename}: {e}")
+    # File moves run on a thread pool; manifest updates stay on this thread
+    with ThreadPoolExecutor(max_workers=MOVE_WORKERS) as pool:
+        for cat_key, filenames in dest_counts.items():
+            folder = CATEGORY_FOLDERS[cat_key]
+            dest_dir = APPS_DIR / folder
+
+            # Ensure destination directory exists
+            dest_dir.mkdir(parents=True, exist_ok=True)
+
+            jobs = []
+            for filename in filenames:
+                src_path = exp_dir / filename
+                dest_path = dest_dir / filename
+
+                if dest_path.exists():
+                    print(f"  ⚠ SKIP {filename} - already exists in {folder}/")
+                    skipped.append(filename)
+                    continue
+
+                # 1-3. Move to new location with updated meta tag
+                job = pool.submit(move_with_meta_category, src_path, dest_path, cat_key)
+                jobs.append((filename, src_path, dest_path, job))
+
+            # Progress lines for this category go out in a single write
+            log = []
+            for filename, src_path, dest_path, job in jobs:
+                try:
+                    job.result()
+                    touched_paths += [src_path, dest_path]
+
+                    # 4. Update manifest: mark for removal from experimental_ai
+                    entry = exp_remaining.pop(filename, None)
+                    if entry:
+                        moved_out.add(filename)
+
+                        # 5. Add to destination category
+                        if cat_key not in manifest["categories"]:
+                            log.append(f"  ⚠ Category {cat_key} not in manifest!\n")
+                            errors.append(f"Missing category: {cat_key}")
+                            continue
+
+                        manifest["categories"][cat_key]["apps"].append(entry)
+                        manifest["categories"][cat_key]["count"] = len(
+                            manifest["categories"][cat_key]["apps"]
+                        )
+
+                    moved += 1
+                    log.append(f"  [{moved:3d}/{total_moving}] {filename:55s} → {folder}/\n")
+
+                except Exception as e:
+                    errors.append(f"{filename}: {e}")
+                    log.append(f"  ✗ ERROR {filename}: {e}\n")
+            sys.stdout.write("".join(log))
+
+    if moved_out:
+        exp_cat = manifest["categories"]["experimental_ai"]
+        exp_cat["apps"] = [e for e in exp_cat["apps"] if e["file"] not in moved_out]
+        exp_cat["count"] = len(exp_cat["apps"])
 
     # Save manifest
     print()
@@ -445,12 +543,6 @@ def main():
 
     # Validate
     print("Validating manifest.json...")
-    try:
-        test = json.load(open(MANIFEST_PATH, encoding="utf-8"))
-        print("  ✓ Valid JSON")
-    except json.JSONDecodeError as e:
-        print(f"  ✗ INVALID JSON: {e}")
-
     val_errors = validate_manifest(manifest)
     if val_errors:
         print("  ⚠ Count mismatches:")
@@ -463,15 +555,17 @@ def main():
     print()
     print("Verifying file integrity...")
     missing_at_dest = 0
+    skipped_set = set(skipped)
     for cat_key, filenames in dest_counts.items():
         folder = CATEGORY_FOLDERS[cat_key]
+        # One directory listing per category instead of a stat per file
+        with os.scandir(APPS_DIR / folder) as it:
+            present = {e.name for e in it}
         for filename in filenames:
-            if filename in skipped:
+            if filename in skipped_set or filename in present:
                 continue
-            dest_path = APPS_DIR / folder / filename
-            if not dest_path.exists():
-                print(f"  ✗ MISSING: {folder}/{filename}")
-                missing_at_dest += 1
+            print(f"  ✗ MISSING: {folder}/{filename}")
+            missing_at_dest += 1
     if missing_at_dest == 0:
         print(f"  ✓ All {moved} moved files verified at destination")
 
@@ -514,15 +608,22 @@ def main():
             if count > 0:
                 dest_summary.append(f"- {count} to {folder}")
 
+        # Joined outside the f-string: a backslash in a replacement field
+        # needs Python 3.12+
+        summary = "\n".join(dest_summary)
         msg = f"""refactor: mass reclassification of experimental-ai ({moved} apps migrated)
 
 Moved {moved} apps from experimental-ai to their correct categories:
-{chr(10).join(dest_summary)}
+{summary}
 
 experimental-ai reduced from 222 to {exp_count} (genuinely experimental apps only)"""
 
+        import subprocess
         try:
-            subprocess.run(["git", "add", "-A", "apps/"], cwd=REPO_ROOT, check=True)
+            subprocess.run(
+                ["git", "add", "-A", "--"] + [str(p.relative_to(REPO_ROOT)) for p in touched_paths],
+                cwd=REPO_ROOT, check=True,
+            )
             subprocess.run(["git", "commit", "-m", msg], cwd=REPO_ROOT, check=True)
             subprocess.run(["git", "push", "origin", "main"], cwd=REPO_ROOT, check=True)
             print("  ✓ Committed and pushed to main")
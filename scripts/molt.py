@@ -9,23 +9,39 @@ functionality, archives the original, and tracks generation history.
 Usage:
   python3 scripts/molt.py memory-training-game.html          # Molt one app
   python3 scripts/molt.py --category games_puzzles            # Molt all in category
+  python3 scripts/molt.py --category games_puzzles --concurrency 5  # 5 apps at a time
+  python3 scripts/molt.py --category games_puzzles --batch-size 4  # 4 small apps per call (classic)
   python3 scripts/molt.py memory-training-game.html --dry-run # Preview only
+  python3 scripts/molt.py memory-training-game.html --no-cache # Ignore saved Copilot replies
   python3 scripts/molt.py --status                            # Show generation table
+  python3 scripts/molt.py --status --status-limit 20          # Top 20 rows only
   python3 scripts/molt.py --rollback memory-training-game 1   # Restore v1
 """
 
+import atexit
+import contextlib
 import hashlib
+import heapq
 import json
+import os
 import re
 import shutil
+import stat
+import subprocess
 import sys
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date
+from html.parser import HTMLParser
 from pathlib import Path
 
 # Import shared utilities
 from copilot_utils import (
     APPS_DIR,
     MANIFEST_PATH,
+    MODEL,
     ROOT,
     VALID_CATEGORIES,
     copilot_call_with_retry,
@@ -33,6 +49,7 @@ from copilot_utils import (
     load_manifest,
     parse_llm_html,
     save_manifest,
+    strip_copilot_wrapper,
 )
 
 # Adaptive content identity (optional -- graceful if missing)
@@ -57,8 +74,13 @@ SCORE_DROP_THRESHOLD = 10  # auto-rollback if score drops more than this
 FEATURE_SCORE_DROP_THRESHOLD = 5  # rollback if drop>5 AND features missing
 COOLDOWN_MIN_GEN_FOR_THRESHOLD = 3  # after gen 3, apply "good enough" threshold
 GOOD_ENOUGH_SCORE = 70  # apps scoring this+ are skipped unless forced
+DEFAULT_CONCURRENCY = 3  # parallel molts in --category mode (Copilot calls in flight)
+BATCH_MAX_CHARS = 40_000  # combined HTML per multi-app prompt (--batch-size)
 
 ARCHIVE_DIR = APPS_DIR / "archive"
+MOLT_LOG_NAME = "molt-log.jsonl"  # per-app audit log inside ARCHIVE_DIR/<stem>
+LEGACY_MOLT_LOG_NAME = "molt-log.json"  # whole-array format, read and migrated on append
+LLM_CACHE_DIRNAME = ".llm_cache"  # inside ARCHIVE_DIR; Copilot replies not yet acted on
 
 # ─── Generation Focus Areas ──────────────────────────────────────────────────
 
@@ -151,19 +173,8 @@ def _get_focus_instructions(generation):
 
 # ─── Prompt Construction ─────────────────────────────────────────────────────
 
-
-def build_molt_prompt(html, filename, generation):
-    """Build a generation-aware improvement prompt."""
-    focus = get_generation_focus(generation)
-    instructions = _get_focus_instructions(generation)
-
-    return f"""You are an expert HTML developer performing generation {generation} improvements on a self-contained HTML application.
-
-GENERATION {generation} FOCUS: {focus.upper()}
-
-{instructions}
-
-HARD RULES:
+# Rules shared by the single-app and multi-app classic prompts
+CLASSIC_RULES = """HARD RULES:
 1. Return ONLY the complete rewritten HTML file -- no explanation, no markdown
 2. Do NOT add new features or change what the app does
 3. Must remain a single self-contained .html file
@@ -174,23 +185,87 @@ HARD RULES:
 8. Do not remove any user-facing UI elements
 
 BUG PREVENTION (critical -- violating these causes the molt to be rejected):
-- Never use CSS var() without quotes in JavaScript: WRONG: {{ color: var(--x) }}  RIGHT: {{ color: 'var(--x)' }}
-- Never comment out closing braces: WRONG: // }}  RIGHT: }}
-- Never put // inside template literal expressions: WRONG: ${{x// }}  RIGHT: ${{x}}
+- Never use CSS var() without quotes in JavaScript: WRONG: { color: var(--x) }  RIGHT: { color: 'var(--x)' }
+- Never comment out closing braces: WRONG: // }  RIGHT: }
+- Never put // inside template literal expressions: WRONG: ${x// }  RIGHT: ${x}
 - Never use optional chaining as assignment target: WRONG: el?.value = x  RIGHT: if (el) el.value = x
 - Escape </script> inside JS string literals as <\\/script>
-- Ensure every {{ has a matching }} -- unbalanced braces crash the app
+- Ensure every { has a matching } -- unbalanced braces crash the app
 - Ensure every try has a catch or finally
-- Use double quotes for strings containing apostrophes: "There's" not 'There's'
+- Use double quotes for strings containing apostrophes: "There's" not 'There's'"""
 
-Filename: {filename}
 
-HTML content:
----
-{html}
----
+_prompt_heads = {}  # generation -> constant prompt text up to "Filename: "
 
-Return ONLY the complete rewritten HTML."""
+
+def _molt_prompt_head(generation):
+    """Return the invariant part of the classic prompt, built once per generation."""
+    head = _prompt_heads.get(generation)
+    if head is None:
+        focus = get_generation_focus(generation)
+        instructions = _get_focus_instructions(generation)
+        head = _prompt_heads[generation] = f"""You are an expert HTML developer performing generation {generation} improvements on a self-contained HTML application.
+
+GENERATION {generation} FOCUS: {focus.upper()}
+
+{instructions}
+
+{CLASSIC_RULES}
+
+Filename: """
+    return head
+
+
+def build_molt_prompt(html, filename, generation):
+    """Build a generation-aware improvement prompt."""
+    return "".join((
+        _molt_prompt_head(generation),
+        filename,
+        "\n\nHTML content:\n---\n",
+        html,
+        "\n---\n\nReturn ONLY the complete rewritten HTML.",
+    ))
+
+
+def build_batch_molt_prompt(docs, generation):
+    """Build one classic prompt that molts several small apps at once.
+
+    docs is a list of (filename, html). Each app is wrapped in
+    <<<APP filename>>> ... <<<END APP>>> markers and the model must answer
+    in the same format, so one call carries several apps.
+    """
+    focus = get_generation_focus(generation)
+    instructions = _get_focus_instructions(generation)
+    apps = "\n\n".join(f"<<<APP {filename}>>>\n{html}\n<<<END APP>>>" for filename, html in docs)
+
+    return f"""You are an expert HTML developer performing generation {generation} improvements on {len(docs)} independent self-contained HTML applications.
+
+GENERATION {generation} FOCUS: {focus.upper()}
+
+{instructions}
+
+{CLASSIC_RULES}
+
+BATCH FORMAT: the rules apply to each app separately. Return every app, rewritten,
+wrapped in the same markers it was given in, and nothing outside the markers:
+<<<APP filename.html>>>
+...complete rewritten HTML...
+<<<END APP>>>
+
+{apps}
+
+Return ONLY the {len(docs)} marked HTML files."""
+
+
+BATCH_APP_RE = re.compile(r"<<<APP ([^>\n]+)>>>\s*\n(.*?)\n\s*<<<END APP>>>", re.DOTALL)
+
+
+def parse_batch_molt_output(raw_output):
+    """Split a multi-app response into {filename: html}. Empty dict if unparseable."""
+    if not raw_output:
+        return {}
+    text = strip_copilot_wrapper(raw_output)
+    return {m.group(1).strip(): m.group(2).strip() for m in BATCH_APP_RE.finditer(text)}
 
 
 def build_adaptive_molt_prompt(html, filename, identity):
@@ -376,64 +451,188 @@ def _score_app_if_available(path):
 
 # ─── JS Syntax Validation ────────────────────────────────────────────────────
 
-# Script types that are not JavaScript and should be skipped
-_SKIP_SCRIPT_TYPES = {"x-shader/x-vertex", "x-shader/x-fragment", "importmap",
-                      "application/json", "application/ld+json"}
+# Script types that are not JavaScript and should be skipped (a tuple, so it
+# can go straight to str.startswith)
+_SKIP_SCRIPT_TYPES = ("x-shader/x-vertex", "x-shader/x-fragment", "importmap",
+                      "application/json", "application/ld+json")
 
+# Patterns used on every molt output, compiled once
+_TITLE_RE = re.compile(r"<title>.+?</title>", re.IGNORECASE | re.DOTALL)
+_EXT_SCRIPT_RE = re.compile(r'<script[^>]+src\s*=\s*["\']https?://', re.IGNORECASE)
+_EXT_CSS_RE = re.compile(r'<link[^>]+href\s*=\s*["\']https?://[^"\']*\.css', re.IGNORECASE)
 
-def _check_js_syntax(html):
-    """Run Node.js vm.Script on each <script> block to catch syntax errors.
 
-    Returns None if all blocks parse OK, or an error string if any fail.
-    Skips shader scripts, importmap, JSON, and module scripts.
+class _ScriptExtractor(HTMLParser):
+    """Collect (attrs, code) for every <script> element in one pass.
+
+    Unlike a regex, this ignores <script> text inside comments and reads the
+    type attribute whether or not it is quoted.
     """
-    import subprocess as _sp
 
-    # Extract regular (non-module, non-special) script blocks
+    def __init__(self):
+        super().__init__(convert_charrefs=False)
+        self.scripts = []
+        self._attrs = None
+        self._buf = []
+
+    def handle_starttag(self, tag, attrs):
+        if tag == "script":
+            self._attrs = dict(attrs)
+            self._buf = []
+
+    def handle_data(self, data):
+        if self._attrs is not None:
+            self._buf.append(data)
+
+    def handle_endtag(self, tag):
+        if tag == "script" and self._attrs is not None:
+            self.scripts.append((self._attrs, "".join(self._buf)))
+            self._attrs = None
+
+
+# Long-lived Node process that checks scripts with vm.Script. Each request is
+# one JSON line {"scripts": [...]}; each reply is {"errors": [...]} holding
+# null or the first message line for every script, in order.
+_NODE_WORKER_JS = (
+    "const vm=require('vm');"
+    "require('readline').createInterface({input:process.stdin}).on('line',l=>{"
+    "const errors=JSON.parse(l).scripts.map(c=>{try{new vm.Script(c);return null}"
+    "catch(e){return e instanceof SyntaxError?(String(e.message).split('\\n')[0]||'Unknown'):null}});"
+    "process.stdout.write(JSON.stringify({errors})+'\\n')})"
+)
+NODE_CHECK_TIMEOUT = 10  # seconds per HTML before the worker is killed
+NODE_PIPE_BUFSIZE = 1 << 16  # worker pipe buffer; small writes coalesce, big ones go straight through
+VALIDATED_JS_MAX = 4096  # digests of script blocks already known to parse
+
+_node_worker = None
+_node_lock = threading.Lock()
+_validated_js = OrderedDict()  # blake2b digest -> None, oldest first
+
+
+def _get_node_worker():
+    """Return the running Node checker, starting it if needed. None if Node is missing."""
+    global _node_worker
+    if _node_worker is None or _node_worker.poll() is not None:
+        try:
+            _node_worker = subprocess.Popen(
+                ["node", "-e", _NODE_WORKER_JS],
+                stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+                bufsize=NODE_PIPE_BUFSIZE,
+            )
+        except OSError:
+            _node_worker = None
+    return _node_worker
+
+
+def _stop_node_worker():
+    """Shut the Node checker down (registered with atexit)."""
+    global _node_worker
+    worker, _node_worker = _node_worker, None
+    if worker is None:
+        return
+    try:
+        worker.stdin.close()
+        worker.wait(timeout=2)
+    except (OSError, subprocess.TimeoutExpired):
+        worker.kill()
+        worker.wait()
+
+
+atexit.register(_stop_node_worker)
+
+
+def _js_blocks(html):
+    """Return the code of every <script> block that vm.Script should check.
+
+    Skips empty blocks, shader scripts, importmap, JSON, and module scripts.
+    """
+    extractor = _ScriptExtractor()
+    extractor.feed(html)
+    extractor.close()
+
     blocks = []
-    for match in re.finditer(r"<script([^>]*)>([\s\S]*?)</script>", html, re.IGNORECASE):
-        attrs = match.group(1)
-        code = match.group(2).strip()
+    for attrs, code in extractor.scripts:
+        code = code.strip()
         if not code:
             continue
         # Skip non-JS types
-        type_match = re.search(r'type\s*=\s*["\']([^"\']+)["\']', attrs)
-        if type_match:
-            stype = type_match.group(1).lower()
-            if any(stype.startswith(skip) for skip in _SKIP_SCRIPT_TYPES):
-                continue
-            if stype == "module":
-                continue  # Module scripts have import/export that vm.Script can't parse
+        stype = (attrs.get("type") or "").strip().lower()
+        if stype.startswith(_SKIP_SCRIPT_TYPES):
+            continue
+        if stype == "module":
+            continue  # Module scripts have import/export that vm.Script can't parse
         blocks.append(code)
+    return blocks
+
+
+def _js_digest(code):
+    return hashlib.blake2b(code.encode("utf-8", errors="surrogatepass"), digest_size=16).digest()
+
+
+def script_digests(html):
+    """Digests of html's checkable script blocks, for _check_js_syntax's known_good."""
+    return frozenset(_js_digest(code) for code in _js_blocks(html))
+
+
+def _check_js_syntax(html, known_good=frozenset()):
+    """Run Node.js vm.Script on each <script> block to catch syntax errors.
 
+    Returns None if all blocks parse OK, or an error string if any fail.
+    Blocks whose digest is in known_good (see script_digests) are not sent.
+    """
+    blocks = _js_blocks(html)
     if not blocks:
         return None
 
-    # Check each block with Node.js vm.Script
-    for code in blocks:
-        check_js = (
-            "const vm=require('vm');"
-            "try{new vm.Script(process.argv[1]);process.exit(0)}"
-            "catch(e){if(e instanceof SyntaxError)"
-            "{process.stderr.write(e.message);process.exit(1)}process.exit(0)}"
-        )
+    # Blocks that parsed before (unchanged by the molt, or helpers shared
+    # between apps) are not sent again
+    digests = [_js_digest(code) for code in blocks]
+
+    # Check every remaining block in one round trip to the shared Node
+    # worker; one process serves every molt instead of a node spawn per block
+    with _node_lock:
+        pending = [(code, d) for code, d in zip(blocks, digests)
+                   if d not in known_good and d not in _validated_js]
+        if not pending:
+            return None
+        worker = _get_node_worker()
+        if worker is None:
+            return None  # Node not available -- skip validation gracefully
+        timer = threading.Timer(NODE_CHECK_TIMEOUT, worker.kill)
+        timer.start()
         try:
-            result = _sp.run(
-                ["node", "-e", check_js, code],
-                capture_output=True, text=True, timeout=10,
-            )
-            if result.returncode != 0:
-                err = result.stderr.strip().split("\n")[0] if result.stderr.strip() else "Unknown"
-                return err
-        except (FileNotFoundError, _sp.TimeoutExpired):
-            # Node not available or timeout -- skip validation gracefully
+            # The payload is ASCII (json.dumps escapes everything else) and is
+            # written as-is; appending the newline would copy the whole thing
+            payload = json.dumps({"scripts": [code for code, _ in pending]}).encode("ascii")
+            worker.stdin.write(payload)
+            worker.stdin.write(b"\n")
+            worker.stdin.flush()
+            reply = worker.stdout.readline()
+            if not reply:
+                raise OSError("node worker exited")
+        except OSError:
+            # Worker died or timed out -- skip validation gracefully, restart next time
+            _stop_node_worker()
             return None
+        finally:
+            timer.cancel()
 
-    return None
+        errors = json.loads(reply)["errors"]
+        for (_, digest), err in zip(pending, errors):
+            if not err:
+                _validated_js[digest] = None
+        while len(_validated_js) > VALIDATED_JS_MAX:
+            _validated_js.popitem(last=False)
 
+    return next((err for err in errors if err), None)
 
-def validate_molt_output(html, original_size):
-    """Validate molted HTML output. Returns None if valid, error string if not."""
+
+def validate_molt_output(html, original_size, known_good=frozenset()):
+    """Validate molted HTML output. Returns None if valid, error string if not.
+
+    known_good holds script_digests() of the pre-molt file, so script blocks
+    the molt left untouched are not re-checked.
+    """
     if not html:
         return "Empty or None output"
 
@@ -445,28 +644,20 @@ def validate_molt_output(html, original_size):
         return "Missing <!DOCTYPE html>"
 
     # Check title
-    if not re.search(r"<title>.+?</title>", html, re.IGNORECASE | re.DOTALL):
+    if not _TITLE_RE.search(html):
         return "Missing or empty <title>"
 
     # Check for external dependencies
-    ext_script = re.search(
-        r'<script[^>]+src\s*=\s*["\']https?://', html, re.IGNORECASE
-    )
+    ext_script = _EXT_SCRIPT_RE.search(html)
     if ext_script:
         return f"External script dependency detected: {ext_script.group()[:80]}"
 
-    ext_css = re.search(
-        r'<link[^>]+href\s*=\s*["\']https?://[^"\']*\.css', html, re.IGNORECASE
-    )
+    ext_css = _EXT_CSS_RE.search(html)
     if ext_css:
         return f"External stylesheet dependency detected: {ext_css.group()[:80]}"
 
-    # ── JS syntax validation ────────────────────────────────────────────────
-    js_error = _check_js_syntax(html)
-    if js_error:
-        return f"JavaScript syntax error: {js_error}"
-
-    # Check size ratio
+    # Check size ratio (before the JS parse, so truncated or runaway output
+    # is rejected without a trip to Node)
     new_size = len(html)
     if original_size > 0:
         ratio = new_size / original_size
@@ -475,6 +666,11 @@ def validate_molt_output(html, original_size):
         if ratio > SIZE_RATIO_MAX:
             return f"Output too large: {new_size} bytes is {ratio:.1%} of original {original_size} bytes (max {SIZE_RATIO_MAX:.0%})"
 
+    # ── JS syntax validation (most expensive, so last) ──────────────────────
+    js_error = _check_js_syntax(html, known_good)
+    if js_error:
+        return f"JavaScript syntax error: {js_error}"
+
     return None
 
 
@@ -482,22 +678,62 @@ def validate_molt_output(html, original_size):
 
 
 def archive_file(src_path, archive_dir, generation):
-    """Copy the current file to the archive as v<generation>.html."""
+    """Archive the current file as v<generation>.html.
+
+    Hardlinks when possible (same filesystem, no existing vN), so no bytes
+    are copied. This is safe because live files are only ever replaced
+    through _replace_file, never rewritten in place.
+    """
     archive_dir.mkdir(parents=True, exist_ok=True)
     dest = archive_dir / f"v{generation}.html"
-    shutil.copy2(src_path, dest)
+    try:
+        os.link(src_path, dest)
+    except OSError:
+        shutil.copy2(src_path, dest)
     return dest
 
 
-def append_molt_log(archive_dir, entry):
-    """Append an entry to the molt audit log."""
-    log_path = archive_dir / "molt-log.json"
+def _replace_file(path, data, mode=None):
+    """Write bytes to path via a temp file and rename, giving it a new inode.
+
+    The file keeps its permission bits; pass mode (an st_mode already in
+    hand) to skip re-statting path for them.
+    """
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_bytes(data)
+    if mode is None:
+        try:
+            mode = path.stat().st_mode
+        except FileNotFoundError:
+            pass
+    if mode is not None:
+        os.chmod(tmp, stat.S_IMODE(mode))
+    os.replace(tmp, path)
+
+
+def read_molt_log(archive_dir):
+    """Return the molt audit log entries for an archive dir, oldest first."""
+    log_path = archive_dir / MOLT_LOG_NAME
     if log_path.exists():
-        log = json.loads(log_path.read_text())
-    else:
-        log = []
-    log.append(entry)
-    log_path.write_text(json.dumps(log, indent=2))
+        return [json.loads(line) for line in log_path.read_text(encoding="utf-8").splitlines() if line]
+    legacy_path = archive_dir / LEGACY_MOLT_LOG_NAME
+    if legacy_path.exists():
+        return json.loads(legacy_path.read_text(encoding="utf-8"))
+    return []
+
+
+def append_molt_log(archive_dir, entry):
+    """Append an entry to the molt audit log (one JSON object per line)."""
+    log_path = archive_dir / MOLT_LOG_NAME
+    legacy_path = archive_dir / LEGACY_MOLT_LOG_NAME
+    lines = [entry]
+    if legacy_path.exists() and not log_path.exists():
+        # Carry a pre-JSONL log over on its first append
+        lines = json.loads(legacy_path.read_text(encoding="utf-8")) + lines
+    with log_path.open("a", encoding="utf-8") as f:
+        f.write("".join(json.dumps(e) + "\n" for e in lines))
+    if legacy_path.exists():
+        legacy_path.unlink()
 
 
 # ─── Manifest Updates ────────────────────────────────────────────────────────
@@ -518,9 +754,88 @@ def update_manifest_entry(app_entry, generation, size):
     })
 
 
+# ─── LLM Response Cache ──────────────────────────────────────────────────────
+#
+# A Copilot reply is saved as soon as it arrives and dropped once molt_app has
+# acted on it (success, rejection or rollback). What survives is a reply whose
+# run was interrupted -- a killed job or a timed-out workflow -- and re-running
+# the same molt picks it up instead of paying for the call again. Rejected
+# replies are never replayed, so a retry always gets a fresh sample.
+
+
+def _llm_cache_path(cache_dir, prompt, mode):
+    """Return the cache file for a (prompt, model, mode) request."""
+    payload = json.dumps({"prompt": prompt, "model": MODEL, "mode": mode}, sort_keys=True)
+    return cache_dir / f"{hashlib.sha256(payload.encode('utf-8')).hexdigest()}.json"
+
+
+def _llm_cache_get(cache_path):
+    """Return the cached reply, or None on a miss or unreadable entry."""
+    try:
+        return json.loads(cache_path.read_bytes())["output"]
+    except (OSError, ValueError, KeyError):
+        return None
+
+
+def _llm_cache_put(cache_path, prompt, output):
+    """Store a reply atomically."""
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    entry = {"prompt_len": len(prompt), "output": output, "ts": time.time()}
+    _replace_file(cache_path, json.dumps(entry).encode("utf-8"))
+
+
+def _llm_cache_drop(cache_path):
+    """Forget a reply once it has been acted on."""
+    if cache_path is not None:
+        cache_path.unlink(missing_ok=True)
+
+
 # ─── App Resolution ──────────────────────────────────────────────────────────
 
 
+# (manifest, per-category app counts, index) for the manifest last resolved
+_app_index = (None, None, None)
+
+
+def _build_app_index(manifest):
+    """Map each app filename to (category_key, app_entry, position); first entry wins."""
+    index = {}
+    for cat_key, cat_data in manifest["categories"].items():
+        for pos, app_entry in enumerate(cat_data["apps"]):
+            index.setdefault(app_entry["file"], (cat_key, app_entry, pos))
+    return index
+
+
+def _still_indexed(manifest, found):
+    """True if found's entry still sits at its cached position in its category."""
+    cat_key, app_entry, pos = found
+    cat_data = manifest["categories"].get(cat_key)
+    apps = cat_data["apps"] if cat_data else ()
+    return pos < len(apps) and apps[pos] is app_entry
+
+
+def _lookup_app(manifest, filename):
+    """Return (category_key, app_entry) for filename, or None.
+
+    The index is rebuilt when a different manifest is passed, when any
+    category's app count changes, or when the cached entry is no longer at
+    its recorded place in its category (so moves and swaps made during a
+    run are still seen).
+    """
+    global _app_index
+    counts = tuple(len(cat["apps"]) for cat in manifest["categories"].values())
+    cached_manifest, cached_counts, index = _app_index
+    if cached_manifest is not manifest or cached_counts != counts:
+        index = _build_app_index(manifest)
+        _app_index = (manifest, counts, index)
+    found = index.get(filename)
+    if found is not None and not _still_indexed(manifest, found):
+        index = _build_app_index(manifest)
+        _app_index = (manifest, counts, index)
+        found = index.get(filename)
+    return found[:2] if found is not None else None
+
+
 def resolve_app(identifier, _manifest=None, _apps_dir=None):
     """Find an app by filename (with or without .html extension).
 
@@ -534,18 +849,18 @@ def resolve_app(identifier, _manifest=None, _apps_dir=None):
     if not identifier.endswith(".html"):
         identifier = identifier + ".html"
 
-    for cat_key, cat_data in manifest["categories"].items():
-        for app_entry in cat_data["apps"]:
-            if app_entry["file"] == identifier:
-                folder = cat_data["folder"]
-                path = apps_dir / folder / identifier
-                if path.exists():
-                    return path, cat_key, app_entry
-                # Entry exists in manifest but file missing
-                raise FileNotFoundError(
-                    f"Manifest entry found for '{identifier}' in {cat_key}, "
-                    f"but file not found at {path}"
-                )
+    found = _lookup_app(manifest, identifier)
+    if found is not None:
+        cat_key, app_entry = found
+        folder = manifest["categories"][cat_key]["folder"]
+        path = apps_dir / folder / identifier
+        if path.exists():
+            return path, cat_key, app_entry
+        # Entry exists in manifest but file missing
+        raise FileNotFoundError(
+            f"Manifest entry found for '{identifier}' in {cat_key}, "
+            f"but file not found at {path}"
+        )
 
     raise FileNotFoundError(
         f"No manifest entry found for '{identifier}'. "
@@ -553,6 +868,48 @@ def resolve_app(identifier, _manifest=None, _apps_dir=None):
     )
 
 
+# ─── Concurrent Output ───────────────────────────────────────────────────────
+
+
+_output_label = threading.local()
+
+
+class _LabelledStdout:
+    """sys.stdout stand-in that tags each line with the writing thread's app.
+
+    Concurrent molts interleave their verbose output; each worker's lines
+    are held until complete and written whole as "[<app>] <line>". Threads
+    without a label (the main thread) write straight through.
+    """
+
+    def __init__(self, target):
+        self._target = target
+
+    def write(self, s):
+        label = getattr(_output_label, "value", None)
+        if label is None:
+            return self._target.write(s)
+        *lines, _output_label.pending = (_output_label.pending + s).split("\n")
+        if lines:
+            self._target.write("".join(f"[{label}] {line}\n" for line in lines))
+        return len(s)
+
+    def __getattr__(self, name):
+        return getattr(self._target, name)
+
+
+@contextlib.contextmanager
+def _labelled_output(label):
+    """Tag this thread's output with label while sys.stdout is a _LabelledStdout."""
+    _output_label.value, _output_label.pending = label, ""
+    try:
+        yield
+    finally:
+        if _output_label.pending:
+            sys.stdout.write("\n")
+        _output_label.value = None
+
+
 # ─── Core Molt Pipeline ─────────────────────────────────────────────────────
 
 
@@ -567,8 +924,10 @@ def molt_app(
     use_contract=True,
     use_score_gate=True,
     force=False,
+    use_cache=True,
     _manifest=None,
     _apps_dir=None,
+    _llm_output=None,
 ):
     """Molt a single app through one generation.
 
@@ -577,6 +936,10 @@ def molt_app(
         use_contract: If True, extract feature contract before molt and verify after.
         use_score_gate: If True, auto-rollback if score drops significantly.
         force: If True, override cooldown and "good enough" threshold.
+        use_cache: If True, reuse a Copilot reply saved by an interrupted run
+            of the same prompt (see _llm_cache_path).
+        _llm_output: Improved HTML already produced by a batched call; skips
+            the per-app LLM call but not validation, archiving or the gates.
 
     Returns a dict with status and details.
     """
@@ -616,7 +979,7 @@ def molt_app(
         try:
             rankings_path = apps_dir / "rankings.json"
             if rankings_path.exists():
-                rankings = json.loads(rankings_path.read_text())
+                rankings = json.loads(rankings_path.read_bytes())
                 for ranked in rankings.get("rankings", []):
                     if ranked.get("file") == filename:
                         current_score = ranked.get("score", 0)
@@ -632,17 +995,19 @@ def molt_app(
         except Exception:
             pass  # rankings unavailable, continue
 
-    # Read current content
-    html = path.read_text(encoding="utf-8", errors="replace")
-    original_size = len(html)
-
-    # Check file size cap
-    if original_size > max_size:
-        reason = f"File too large: {original_size} bytes (max {max_size})"
+    # Check file size cap from the inode, so oversized files are never read
+    st = path.stat()
+    file_size = st.st_size
+    if file_size > max_size:
+        reason = f"File too large: {file_size} bytes (max {max_size})"
         if verbose:
             print(f"  SKIP: {reason}")
         return {"status": "skipped", "reason": reason}
 
+    # Read current content
+    html = path.read_text(encoding="utf-8", errors="replace")
+    original_size = len(html)
+
     # ── Feature contract extraction (before LLM call) ──
     contract = None
     if use_contract and extract_features is not None:
@@ -707,12 +1072,28 @@ def molt_app(
             "focus": focus,
         }
 
-    if verbose:
-        print(f"  Calling Copilot CLI...")
-
-    # Scale timeout with file size: 180s base + 60s per MB
-    timeout_secs = max(180, 180 + int(original_size / 1_000_000) * 60)
-    raw_output = copilot_call_with_retry(prompt, timeout=timeout_secs)
+    cache_path = None
+    if _llm_output is not None:
+        raw_output = _llm_output
+    else:
+        mode = "surgical" if surgical else ("adaptive" if identity else "classic")
+        if use_cache:
+            cache_path = _llm_cache_path(archive_base / LLM_CACHE_DIRNAME, prompt, mode)
+        raw_output = _llm_cache_get(cache_path) if cache_path else None
+        if raw_output is not None:
+            if verbose:
+                print(f"  LLM cache: hit ({cache_path.name[:12]})")
+        else:
+            if verbose:
+                if cache_path:
+                    print(f"  LLM cache: miss")
+                print(f"  Calling Copilot CLI...")
+
+            # Scale timeout with file size: 180s base + 60s per MB
+            timeout_secs = max(180, 180 + int(original_size / 1_000_000) * 60)
+            raw_output = copilot_call_with_retry(prompt, timeout=timeout_secs)
+            if raw_output and cache_path:
+                _llm_cache_put(cache_path, prompt, raw_output)
     if verbose and raw_output:
         print(f"  Raw output length: {len(raw_output)} chars")
         print(f"  Raw output preview: {raw_output[:300]}...")
@@ -731,6 +1112,7 @@ def molt_app(
         improved_html = parse_llm_html(raw_output)
 
     if not improved_html:
+        _llm_cache_drop(cache_path)
         return {
             "status": "failed",
             "reason": "Copilot returned empty or unparseable response",
@@ -738,8 +1120,9 @@ def molt_app(
         }
 
     # Validate output
-    error = validate_molt_output(improved_html, original_size)
+    error = validate_molt_output(improved_html, original_size, script_digests(html))
     if error:
+        _llm_cache_drop(cache_path)
         if verbose:
             print(f"  REJECTED: {error}")
         return {
@@ -768,6 +1151,7 @@ def molt_app(
             )
             if verbose:
                 print(f"  REJECTED: {reason}")
+            _llm_cache_drop(cache_path)
             return {
                 "status": "rejected",
                 "reason": reason,
@@ -786,8 +1170,12 @@ def molt_app(
     if verbose:
         print(f"  Archived: {archive_dir}/v{next_gen}.html")
 
-    # Write improved version
-    path.write_text(improved_html, encoding="utf-8")
+    # Write improved version, hashing the file it replaces first for the audit log
+    with path.open("rb") as f:
+        prev_sha = hashlib.file_digest(f, "sha256").hexdigest()
+    encoded = improved_html.encode("utf-8")
+    _replace_file(path, encoded, mode=st.st_mode)
+    _llm_cache_drop(cache_path)
     if verbose:
         print(f"  Replaced: {path}")
 
@@ -802,7 +1190,7 @@ def molt_app(
             try:
                 rankings_path = apps_dir / "rankings.json"
                 if rankings_path.exists():
-                    rankings = json.loads(rankings_path.read_text())
+                    rankings = json.loads(rankings_path.read_bytes())
                     for ranked in rankings.get("rankings", []):
                         if ranked.get("file") == filename:
                             score_before = ranked.get("score", 0)
@@ -836,7 +1224,7 @@ def molt_app(
                     # Restore from archive
                     archived = archive_dir / f"v{next_gen}.html"
                     if archived.exists():
-                        path.write_text(html, encoding="utf-8")
+                        _replace_file(path, html.encode("utf-8"), mode=st.st_mode)
                     if verbose:
                         print(f"  ROLLBACK: {rollback_reason}")
                     return {
@@ -849,8 +1237,7 @@ def molt_app(
                     }
 
     # Write audit log
-    prev_sha = hashlib.sha256(html.encode()).hexdigest()
-    new_sha = hashlib.sha256(improved_html.encode()).hexdigest()
+    new_sha = hashlib.sha256(encoded).hexdigest()
     log_entry = {
         "generation": next_gen,
         "date": date.today().isoformat(),
@@ -890,40 +1277,134 @@ def molt_app(
     return result
 
 
+def molt_apps_batched(
+    identifiers,
+    batch_size,
+    concurrency=1,
+    _manifest=None,
+    _apps_dir=None,
+    **molt_kwargs,
+):
+    """Molt many apps, packing small ones several to an LLM call (classic mode).
+
+    Apps are grouped by next generation, so one focus fits the whole prompt,
+    into batches of at most batch_size apps and BATCH_MAX_CHARS of HTML.
+    Each returned document then goes through molt_app as a classic molt.
+    Apps that are too large, may hit the cooldown check, are alone in their
+    group, or are missing from the response get a regular single-app molt
+    in the mode given by molt_kwargs (adaptive / surgical).
+
+    Returns a list of (identifier, result) in input order.
+    """
+    manifest = _manifest or load_manifest()
+    apps_dir = _apps_dir or APPS_DIR
+    molt_kwargs.update(_manifest=manifest, _apps_dir=apps_dir)
+    classic_kwargs = dict(molt_kwargs, adaptive=False, surgical=False)
+    max_gen = molt_kwargs.get("max_gen", DEFAULT_MAX_GEN)
+    cooldown_gen = max_gen if molt_kwargs.get("force") else COOLDOWN_MIN_GEN_FOR_THRESHOLD
+
+    by_gen = {}
+    for ident in identifiers if not molt_kwargs.get("dry_run") else ():
+        try:
+            path, _, app_entry = resolve_app(ident, _manifest=manifest, _apps_dir=apps_dir)
+        except FileNotFoundError:
+            continue
+        gen = app_entry.get("generation", 0)
+        size = path.stat().st_size
+        if gen >= min(max_gen, cooldown_gen) or size > BATCH_MAX_CHARS // 2:
+            continue
+        batches = by_gen.setdefault(gen + 1, [[]])
+        batch = batches[-1]
+        if len(batch) >= batch_size or sum(n for _, _, n in batch) + size > BATCH_MAX_CHARS:
+            batch = []
+            batches.append(batch)
+        batch.append((ident, path, size))
+
+    jobs = [(gen, batch) for gen, batches in by_gen.items() for batch in batches if len(batch) > 1]
+
+    def run_batch(job):
+        gen, batch = job
+        docs = [(path.name, path.read_text(encoding="utf-8", errors="replace")) for _, path, _ in batch]
+        raw_output = copilot_call_with_retry(build_batch_molt_prompt(docs, gen), timeout=180 + 60 * len(batch))
+        parsed = parse_batch_molt_output(raw_output)
+        return {ident: parsed[path.name] for ident, path, _ in batch if parsed.get(path.name)}
+
+    outputs = {}
+    workers = max(1, min(concurrency, len(identifiers)))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for found in executor.map(run_batch, jobs):
+            outputs.update(found)
+        def molt_one(ident):
+            output = outputs.get(ident)
+            with _labelled_output(ident):
+                try:
+                    if output is None:
+                        return molt_app(ident, **molt_kwargs)
+                    return molt_app(ident, _llm_output=output, **classic_kwargs)
+                except Exception as e:
+                    # One crash must not stop the caller saving the manifest
+                    # for molts that already replaced their files
+                    return {"status": "failed", "reason": f"{type(e).__name__}: {e}"}
+
+        results = executor.map(molt_one, identifiers)
+        return list(zip(identifiers, results))
+
+
 # ─── Status ──────────────────────────────────────────────────────────────────
 
 
-def get_status(manifest=None):
-    """Return a list of all apps with their generation info."""
+def iter_status(manifest=None):
+    """Yield each app's generation info, in manifest order."""
     manifest = manifest or load_manifest()
-    status = []
     for cat_key, cat_data in manifest["categories"].items():
         for app in cat_data["apps"]:
-            status.append({
+            yield {
                 "file": app["file"],
                 "category": cat_key,
                 "title": app.get("title", ""),
                 "generation": app.get("generation", 0),
                 "lastMolted": app.get("lastMolted", ""),
-            })
-    return status
+            }
+
+
+def get_status(manifest=None):
+    """Return a list of all apps with their generation info."""
+    return list(iter_status(manifest))
 
 
-def print_status(manifest=None):
-    """Print a formatted generation status table."""
-    status = get_status(manifest)
-    status.sort(key=lambda s: (-s["generation"], s["category"], s["file"]))
+def _status_order(s):
+    return (-s["generation"], s["category"], s["file"])
 
-    print(f"\n{'File':<45} {'Category':<20} {'Gen':>3} {'Last Molted':<12}")
-    print("-" * 82)
-    for s in status:
+
+def print_status(manifest=None, limit=None):
+    """Print a formatted generation status table.
+
+    With limit, only the first `limit` rows in table order are kept (via a
+    bounded heap), but the totals still cover every app.
+    """
+    counts = {"total": 0, "molted": 0}
+
+    def counted():
+        for s in iter_status(manifest):
+            counts["total"] += 1
+            counts["molted"] += s["generation"] > 0
+            yield s
+
+    if limit is None:
+        rows = sorted(counted(), key=_status_order)
+    else:
+        rows = heapq.nsmallest(limit, counted(), key=_status_order)
+
+    lines = [f"\n{'File':<45} {'Category':<20} {'Gen':>3} {'Last Molted':<12}", "-" * 82]
+    for s in rows:
         gen = s["generation"]
         last = s["lastMolted"] or "never"
-        print(f"{s['file']:<45} {s['category']:<20} {gen:>3} {last:<12}")
+        lines.append(f"{s['file']:<45} {s['category']:<20} {gen:>3} {last:<12}")
+    if len(rows) < counts["total"]:
+        lines.append(f"... {counts['total'] - len(rows)} more")
+    print("\n".join(lines))
 
-    total = len(status)
-    molted = sum(1 for s in status if s["generation"] > 0)
-    print(f"\n{molted}/{total} apps have been molted.")
+    print(f"\n{counts['molted']}/{counts['total']} apps have been molted.")
 
 
 # ─── Rollback ────────────────────────────────────────────────────────────────
@@ -958,7 +1439,7 @@ def rollback_app(identifier, target_gen, _manifest=None, _apps_dir=None):
 
     # Restore
     archived_html = archive_path.read_text(encoding="utf-8")
-    live_path.write_text(archived_html, encoding="utf-8")
+    _replace_file(live_path, archived_html.encode("utf-8"))
 
     return {
         "status": "rolled_back",
@@ -993,6 +1474,20 @@ def main():
         if idx + 1 < len(args):
             max_size = int(args[idx + 1])
 
+    # Parse --concurrency N
+    concurrency = DEFAULT_CONCURRENCY
+    if "--concurrency" in args:
+        idx = args.index("--concurrency")
+        if idx + 1 < len(args):
+            concurrency = max(1, int(args[idx + 1]))
+
+    # Parse --batch-size N (apps per Copilot call in --category mode)
+    batch_size = 1
+    if "--batch-size" in args:
+        idx = args.index("--batch-size")
+        if idx + 1 < len(args):
+            batch_size = max(1, int(args[idx + 1]))
+
     # Parse --category <key>
     category = None
     if "--category" in args:
@@ -1002,7 +1497,13 @@ def main():
 
     # ── Status mode ──
     if "--status" in flags:
-        print_status()
+        # Parse --status-limit N (show only the top N rows)
+        status_limit = None
+        if "--status-limit" in args:
+            idx = args.index("--status-limit")
+            if idx + 1 < len(args):
+                status_limit = max(0, int(args[idx + 1]))
+        print_status(limit=status_limit)
         return 0
 
     # ── Rollback mode ──
@@ -1034,18 +1535,23 @@ def main():
     use_contract = "--no-contract" not in flags
     use_score_gate = "--no-score-gate" not in flags
     force = "--force" in flags
+    use_cache = "--no-cache" not in flags
     if surgical:
         print("molt: SURGICAL MODE (JSON patches)")
     elif adaptive:
         print("molt: ADAPTIVE MODE (content-aware)")
     else:
         print("molt: CLASSIC MODE (generation-based)")
+    if category and batch_size > 1:
+        print(f"molt: small apps BATCHED (up to {batch_size} per call, classic prompt)")
     if use_contract:
         print("molt: feature contracts ENABLED")
     if use_score_gate:
         print("molt: score gate ENABLED")
     if force:
         print("molt: FORCE (cooldown override)")
+    if not use_cache:
+        print("molt: LLM response cache DISABLED")
     if dry_run:
         print("molt: DRY RUN MODE")
 
@@ -1058,26 +1564,59 @@ def main():
             return 1
 
         apps = manifest["categories"][category]["apps"]
-        print(f"\nmolt: processing {len(apps)} apps in {category}")
-
+        print(f"\nmolt: processing {len(apps)} apps in {category} ({concurrency} at a time)")
+
+        molt_kwargs = dict(
+            dry_run=dry_run,
+            verbose=verbose,
+            max_gen=max_gen,
+            max_size=max_size,
+            use_contract=use_contract,
+            use_score_gate=use_score_gate,
+            force=force,
+            use_cache=use_cache,
+            _manifest=manifest,
+        )
         results = {"success": 0, "skipped": 0, "failed": 0, "rejected": 0, "dry_run": 0}
-        for app in apps:
-            print(f"\n--- {app['file']} ---")
-            result = molt_app(
-                app["file"],
-                dry_run=dry_run,
-                verbose=verbose,
-                max_gen=max_gen,
-                max_size=max_size,
-                adaptive=adaptive,
-                surgical=surgical,
-                use_contract=use_contract,
-                use_score_gate=use_score_gate,
-                force=force,
-                _manifest=manifest,
-            )
+
+        def report(filename, result):
+            print(f"\n--- {filename} ---")
             results[result["status"]] = results.get(result["status"], 0) + 1
             print(f"  => {result['status']}")
+            if result["status"] == "failed" and result.get("reason"):
+                print(f"     {result['reason']}")
+
+        # With several molts in flight, each worker's lines carry its filename
+        stdout = sys.stdout
+        if concurrency > 1 and len(apps) > 1:
+            sys.stdout = _LabelledStdout(stdout)
+        try:
+            if batch_size > 1:
+                # Small apps share one classic prompt, several to a Copilot call;
+                # the rest keep the requested mode
+                for filename, result in molt_apps_batched(
+                    [app["file"] for app in apps], batch_size, concurrency=concurrency,
+                    adaptive=adaptive, surgical=surgical, **molt_kwargs
+                ):
+                    report(filename, result)
+            else:
+                def molt_one(app):
+                    with _labelled_output(app["file"]):
+                        try:
+                            return molt_app(app["file"], adaptive=adaptive, surgical=surgical, **molt_kwargs)
+                        except Exception as e:
+                            # Keep going so the manifest below records every
+                            # molt that did complete
+                            return {"status": "failed", "reason": f"{type(e).__name__}: {e}"}
+
+                # Each molt waits minutes on the LLM, so run several at once. Apps
+                # touch only their own file, archive dir and manifest entry; results
+                # are reported in category order as they complete.
+                with ThreadPoolExecutor(max_workers=max(1, min(concurrency, len(apps)))) as executor:
+                    for app, result in zip(apps, executor.map(molt_one, apps)):
+                        report(app["file"], result)
+        finally:
+            sys.stdout = stdout
 
         if not dry_run:
             save_manifest(manifest)
@@ -1088,8 +1627,8 @@ def main():
     # ── Single app mode ──
     if not positional:
         print("Usage: molt.py <app-file> [--dry-run] [--verbose] [--max-gen N] [--classic]")
-        print("       molt.py --category <category_key>")
-        print("       molt.py --status")
+        print("       molt.py --category <category_key> [--concurrency N] [--batch-size N]")
+        print("       molt.py --status [--status-limit N]")
         print("       molt.py --rollback <app-name> <generation>")
         print("")
         print("  Modes:  --classic    Fixed 5-generation cycle")
@@ -1097,6 +1636,7 @@ def main():
         print("  Guards: --no-contract   Skip feature contract verification")
         print("          --no-score-gate Skip score regression check")
         print("          --force         Override cooldown / good-enough threshold")
+        print("          --no-cache      Ignore replies saved by interrupted runs")
         return 1
 
     app_file = positional[0]
@@ -1113,6 +1653,7 @@ def main():
         use_contract=use_contract,
         use_score_gate=use_score_gate,
         force=force,
+        use_cache=use_cache,
         _manifest=manifest,
     )
 
@@ -176,7 +176,7 @@ class TestGenerateFeeds:
     def test_build_feed_json_schema(self):
         """build_feed_json produces valid Schema.org DataFeed structure."""
         mod = self._import()
-        feed = mod.build_feed_json(SAMPLE_MANIFEST, SAMPLE_RANKINGS_FLAT)
+        feed = mod.build_feed_json(SAMPLE_MANIFEST, mod.build_scores(SAMPLE_RANKINGS_FLAT))
         assert feed["@context"] == "https://schema.org"
         assert feed["@type"] == "DataFeed"
         assert "dataFeedElement" in feed
@@ -186,7 +186,7 @@ class TestGenerateFeeds:
     def test_feed_json_item_count(self):
         """Number of DataFeedElement items matches total manifest apps."""
         mod = self._import()
-        feed = mod.build_feed_json(SAMPLE_MANIFEST, [])
+        feed = mod.build_feed_json(SAMPLE_MANIFEST, mod.build_scores([]))
         total_apps = sum(
             len(c.get("apps", []))
             for c in SAMPLE_MANIFEST["categories"].values()
@@ -196,7 +196,7 @@ class TestGenerateFeeds:
     def test_feed_json_item_fields(self):
         """Each DataFeedElement item has required Schema.org fields."""
         mod = self._import()
-        feed = mod.build_feed_json(SAMPLE_MANIFEST, SAMPLE_RANKINGS_FLAT)
+        feed = mod.build_feed_json(SAMPLE_MANIFEST, mod.build_scores(SAMPLE_RANKINGS_FLAT))
         item = feed["dataFeedElement"][0]
         assert item["@type"] == "DataFeedItem"
         inner = item["item"]
@@ -207,7 +207,7 @@ class TestGenerateFeeds:
     def test_feed_json_rating_from_rankings(self):
         """Rankings scores appear as aggregateRating in feed items."""
         mod = self._import()
-        feed = mod.build_feed_json(SAMPLE_MANIFEST, SAMPLE_RANKINGS_FLAT)
+        feed = mod.build_feed_json(SAMPLE_MANIFEST, mod.build_scores(SAMPLE_RANKINGS_FLAT))
         # test-game.html has score=75
         game_item = [e for e in feed["dataFeedElement"]
                      if e["item"]["name"] == "Test Game"][0]
@@ -217,18 +217,18 @@ class TestGenerateFeeds:
     def test_build_feed_xml_valid_rss(self):
         """build_feed_xml produces valid RSS 2.0 structure."""
         mod = self._import()
-        xml = mod.build_feed_xml(SAMPLE_MANIFEST, [])
-        assert xml.startswith("<?xml version=")
-        assert "<rss version=\"2.0\"" in xml
-        assert "<channel>" in xml
-        assert "<item>" in xml
-        assert "</rss>" in xml
+        xml = mod.build_feed_xml(SAMPLE_MANIFEST, mod.build_scores([]))
+        assert xml.startswith(b"<?xml version=")
+        assert b"<rss version=\"2.0\"" in xml
+        assert b"<channel>" in xml
+        assert b"<item>" in xml
+        assert b"</rss>" in xml
 
     def test_feed_xml_item_count(self):
         """RSS feed has correct number of <item> elements."""
         mod = self._import()
-        xml = mod.build_feed_xml(SAMPLE_MANIFEST, [])
-        item_count = xml.count("<item>")
+        xml = mod.build_feed_xml(SAMPLE_MANIFEST, mod.build_scores([]))
+        item_count = xml.count(b"<item>")
         total_apps = sum(
             len(c.get("apps", []))
             for c in SAMPLE_MANIFEST["categories"].values()
@@ -238,8 +238,8 @@ class TestGenerateFeeds:
     def test_feed_xml_score_note(self):
         """RSS description includes score note when rankings provided."""
         mod = self._import()
-        xml = mod.build_feed_xml(SAMPLE_MANIFEST, SAMPLE_RANKINGS_FLAT)
-        assert "(score: 75/100)" in xml
+        xml = mod.build_feed_xml(SAMPLE_MANIFEST, mod.build_scores(SAMPLE_RANKINGS_FLAT))
+        assert b"(score: 75/100)" in xml
 
     def test_load_rankings_nested_dict(self, tmp_path):
         """load_rankings extracts list from nested {'rankings': [...]}."""
@@ -268,12 +268,33 @@ class TestGenerateFeeds:
         result = mod.load_rankings(str(f))
         assert result == []
 
+    def test_build_scores(self):
+        """build_scores maps file to score and tolerates missing rankings."""
+        mod = self._import()
+        assert mod.build_scores(SAMPLE_RANKINGS_FLAT) == {"test-game.html": 75}
+        assert mod.build_scores(None) == {}
+
     def test_feed_json_empty_manifest(self):
         """build_feed_json handles manifest with no categories."""
         mod = self._import()
-        feed = mod.build_feed_json({"categories": {}}, [])
+        feed = mod.build_feed_json({"categories": {}}, mod.build_scores([]))
         assert feed["dataFeedElement"] == []
 
+    def test_write_feed_json_matches_build(self, tmp_path):
+        """write_feed_json streams the same document build_feed_json returns."""
+        mod = self._import()
+        scores = mod.build_scores(SAMPLE_RANKINGS_FLAT)
+        for manifest in (SAMPLE_MANIFEST, {"categories": {}}):
+            path = tmp_path / "feed.json"
+            count = mod.write_feed_json(str(path), manifest, scores)
+            written = json.loads(path.read_text())
+            built = mod.build_feed_json(manifest, scores)
+            written.pop("dateModified")
+            built.pop("dateModified")
+            assert written == built
+            assert count == len(built["dataFeedElement"])
+            assert not list(tmp_path.glob("*.tmp"))
+
 
 # ─── TestSubagentSwarm ───────────────────────────────────────────────────────
 
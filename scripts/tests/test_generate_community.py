@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""Tests for the non-LLM helpers in generate_community.py."""
+
+import io
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import generate_community as gc
+
+
+def _sample_community():
+    return {
+        "meta": {"generated": "2026-01-01T00:00:00+00:00", "note": "café — test"},
+        "players": [
+            {"id": "p0000", "username": "alpha", "color": "#fff"},
+            {"id": "p0001", "username": "beta", "color": "#000"},
+        ],
+        "comments": {
+            "app-one": [{"id": "c1", "text": "nice", "children": []}],
+            "app-two": [],
+        },
+        "ratings": {"app-one": [4, 5]},
+        "activity": [],
+        "onlineSchedule": {0: 50, 23: 120},
+    }
+
+
+class TestWriteStream:
+    def test_matches_json_dump(self):
+        community = _sample_community()
+        buf = io.BytesIO()
+        gc.write_stream(buf, community)
+        assert buf.getvalue() == json.dumps(community, separators=(",", ":")).encode()
+
+    def test_empty_comments(self):
+        community = _sample_community()
+        community["comments"] = {}
+        buf = io.BytesIO()
+        gc.write_stream(buf, community)
+        assert json.loads(buf.getvalue())["comments"] == {}
+
+    def test_empty_players(self):
+        community = _sample_community()
+        community["players"] = []
+        buf = io.BytesIO()
+        gc.write_stream(buf, community)
+        assert json.loads(buf.getvalue())["players"] == []
+
+
+class TestOnlineSchedule:
+    SEED = "2026-01-01T00:00:00+00:00"
+
+    def test_covers_every_hour_within_range(self):
+        schedule = gc.generate_online_schedule(self.SEED)
+        assert sorted(schedule) == list(range(24))
+        for hour, (lo, hi) in enumerate(gc.ONLINE_HOUR_RANGES):
+            assert 45 + lo <= schedule[hour] <= 45 + hi
+
+    def test_serializes_with_string_hours(self):
+        encoded = json.loads(json.dumps(gc.generate_online_schedule(self.SEED)))
+        assert set(encoded) == {str(h) for h in range(24)}
+
+    def test_counts_stay_in_range_across_runs(self):
+        schedules = [gc.generate_online_schedule(f"2026-01-01T00:00:{s:02d}+00:00")
+                     for s in range(20)]
+        for schedule in schedules:
+            for hour, (lo, hi) in enumerate(gc.ONLINE_HOUR_RANGES):
+                assert 45 + lo <= schedule[hour] <= 45 + hi
+        assert len({tuple(sorted(s.items())) for s in schedules}) > 1
+
+
+class TestInputHash:
+    def _patch_paths(self, monkeypatch, tmp_path):
+        monkeypatch.setattr(gc, "MANIFEST", tmp_path / "manifest.json")
+        monkeypatch.setattr(gc, "RANKINGS", tmp_path / "rankings.json")
+        monkeypatch.setattr(gc, "OUTPUT", tmp_path / "community.json")
+        gc.MANIFEST.write_text('{"categories": {}}')
+
+    def test_hash_changes_with_rankings(self, monkeypatch, tmp_path):
+        self._patch_paths(monkeypatch, tmp_path)
+        without = gc.compute_input_hash()
+        gc.RANKINGS.write_text('{"rankings": []}')
+        assert gc.compute_input_hash() != without
+
+    def test_previous_hash_roundtrip(self, monkeypatch, tmp_path):
+        self._patch_paths(monkeypatch, tmp_path)
+        assert gc.load_previous_input_hash() is None
+        gc.OUTPUT.write_text(json.dumps({"meta": {"inputHash": "abc"}}))
+        assert gc.load_previous_input_hash() == "abc"
+
+    def test_main_skips_when_inputs_unchanged(self, monkeypatch, tmp_path, capsys):
+        self._patch_paths(monkeypatch, tmp_path)
+        gc.OUTPUT.write_text(json.dumps({"meta": {"inputHash": gc.compute_input_hash()}}))
+        monkeypatch.setattr(sys, "argv", ["generate_community.py"])
+        monkeypatch.setattr(gc, "detect_backend", lambda: pytest.fail("should not run"))
+        gc.main()
+        assert "up-to-date" in capsys.readouterr().out
+
+
+class TestIndexRankings:
+    def test_first_entry_wins(self):
+        data = {"rankings": [{"file": "a.html", "score": 1}, {"file": "a.html", "score": 2}]}
+        assert gc.index_rankings(data)["a.html"]["score"] == 1
+
+    def test_missing_rankings(self):
+        assert gc.index_rankings(None) == {}
+
+
+class TestRatings:
+    def test_stars_follow_quality_tier(self):
+        apps = [{"app": {"file": f"a{i}.html"}} for i in range(4)]
+        rankings = {"rankings": [
+            {"file": "a0.html", "score": 90}, {"file": "a1.html", "score": 65},
+            {"file": "a2.html", "score": 45}, {"file": "a3.html", "score": 10},
+        ]}
+        ratings = gc.generate_ratings(apps, gc.index_rankings(rankings))
+        allowed = {"a0": {3, 4, 5}, "a1": {2, 3, 4, 5}, "a2": {1, 2, 3, 4}, "a3": {1, 2, 3}}
+        for stem, stars in ratings.items():
+            assert 5 <= len(stars) <= 50
+            assert set(stars) <= allowed[stem]
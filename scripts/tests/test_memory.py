@@ -206,3 +206,203 @@ class TestCrossAgentQuery:
         }))
         results = get_all_entries_for_target("apps/x.html")
         assert len(results) == 0
+
+
+class TestLedgerCache:
+    def test_hash_matches_full_recompute(self, isolated_memory):
+        from scripts.memory import append_relationship, load_ledger, _compute_consistency_hash
+        for rid in ("m", "a", "z"):
+            append_relationship({"id": rid, "source": "a", "target": "b",
+                                 "relation": "teaches", "agent": "x"})
+        ledger = load_ledger()
+        assert ledger["consistencyHash"] == _compute_consistency_hash(ledger["relationships"])
+
+    def test_picks_up_external_rewrite(self, isolated_memory):
+        from scripts.memory import append_relationship, load_ledger
+        append_relationship({"source": "a", "target": "b", "relation": "teaches", "agent": "x"})
+        assert len(load_ledger()["relationships"]) == 1
+        (isolated_memory / "ledger.jsonl").unlink()
+        (isolated_memory / "ledger.json").write_text(json.dumps({
+            "relationships": [], "consistencyHash": "", "extra": True
+        }))
+        assert load_ledger()["relationships"] == []
+
+    def test_loaded_ledger_mutation_does_not_leak(self, isolated_memory):
+        from scripts.memory import append_relationship, load_ledger
+        append_relationship({"source": "a", "target": "b", "relation": "teaches", "agent": "x"})
+        load_ledger()["relationships"].clear()
+        assert len(load_ledger()["relationships"]) == 1
+
+    def test_loaded_relationship_mutation_does_not_leak(self, isolated_memory):
+        from scripts.memory import append_relationship, find_relationships, load_ledger
+        append_relationship({"source": "a", "target": "b", "relation": "teaches", "agent": "x"})
+        load_ledger()["relationships"][0]["target"] = "z"
+        find_relationships("b")[0]["note"] = "annotated"
+        rel = load_ledger()["relationships"][0]
+        assert rel["target"] == "b" and "note" not in rel
+
+
+class TestLedgerLog:
+    def test_append_writes_one_log_line(self, isolated_memory):
+        from scripts.memory import append_relationship
+        for _ in range(3):
+            append_relationship({"source": "a", "target": "b", "relation": "teaches", "agent": "x"})
+        lines = (isolated_memory / "ledger.jsonl").read_text().splitlines()
+        assert len(lines) == 3
+        assert not (isolated_memory / "ledger.json").exists()
+
+    def test_compacts_after_threshold(self, isolated_memory, monkeypatch):
+        import scripts.memory as mem
+        monkeypatch.setattr(mem, "LEDGER_COMPACT_AFTER", 2)
+        for _ in range(3):
+            mem.append_relationship({"source": "a", "target": "b", "relation": "teaches", "agent": "x"})
+        snapshot = json.loads((isolated_memory / "ledger.json").read_text())
+        assert len(snapshot["relationships"]) == 2
+        assert len((isolated_memory / "ledger.jsonl").read_text().splitlines()) == 1
+        assert len(mem.load_ledger()["relationships"]) == 3
+
+    def test_skips_torn_line_and_duplicates(self, isolated_memory):
+        from scripts.memory import compact_ledger, load_ledger
+        rel = {"id": "r1", "source": "a", "target": "b", "relation": "teaches", "agent": "x"}
+        (isolated_memory / "ledger.json").write_text(json.dumps({"relationships": [rel], "consistencyHash": ""}))
+        (isolated_memory / "ledger.jsonl").write_text(json.dumps(rel) + "\n" + '{"id": "r2", "sou')
+        assert [r["id"] for r in load_ledger()["relationships"]] == ["r1"]
+        compact_ledger()
+        assert not (isolated_memory / "ledger.jsonl").exists()
+        assert len(load_ledger()["relationships"]) == 1
+
+    def test_append_after_torn_line_survives_reload(self, isolated_memory):
+        import scripts.memory as mem
+        rel = {"id": "r1", "source": "a", "target": "b", "relation": "teaches", "agent": "x"}
+        (isolated_memory / "ledger.jsonl").write_text(json.dumps(rel) + "\n" + '{"id": "r2", "sou')
+        mem.load_ledger()
+        mem.append_relationship({"id": "r3", "source": "a", "target": "c", "relation": "teaches", "agent": "x"})
+        mem._ledger_cache = None
+        assert [r["id"] for r in mem.load_ledger()["relationships"]] == ["r1", "r3"]
+
+
+    def test_append_behind_cache_survives_compaction(self, isolated_memory):
+        import scripts.memory as mem
+        mem.append_relationship({"id": "r1", "source": "a", "target": "b", "relation": "teaches", "agent": "x"})
+        cached = mem._cached_ledger
+        other = {"id": "r2", "source": "a", "target": "c", "relation": "teaches", "agent": "y"}
+
+        def cached_then_other_process_appends():
+            result = cached()
+            with open(isolated_memory / "ledger.jsonl", "a") as f:
+                f.write(json.dumps(other) + "\n")
+            return result
+
+        with patch("scripts.memory._cached_ledger", cached_then_other_process_appends):
+            mem.append_relationship({"id": "r3", "source": "a", "target": "d", "relation": "teaches", "agent": "x"})
+        assert sorted(r["id"] for r in mem.load_ledger()["relationships"]) == ["r1", "r2", "r3"]
+        mem.compact_ledger()
+        mem._ledger_cache = None
+        assert sorted(r["id"] for r in mem.load_ledger()["relationships"]) == ["r1", "r2", "r3"]
+
+
+class TestBatchAppend:
+    def test_append_memory_entries_single_save(self, isolated_memory):
+        from scripts import memory as mem
+        with patch.object(mem, "save_agent_memory", wraps=mem.save_agent_memory) as save:
+            entries = mem.append_memory_entries("batch-agent", [
+                {"type": "note", "target": f"apps/t{i}.html", "data": {}} for i in range(4)
+            ])
+        assert save.call_count == 1
+        assert all("id" in e and "timestamp" in e for e in entries)
+        assert len(mem.load_agent_memory("batch-agent")["entries"]) == 4
+
+    def test_entries_share_last_updated_timestamp(self, isolated_memory):
+        from scripts.memory import append_memory_entry, load_agent_memory
+        entry = append_memory_entry("ts-agent", {"type": "note", "target": "a", "data": {}})
+        assert load_agent_memory("ts-agent")["lastUpdated"] == entry["timestamp"]
+
+    def test_append_memory_entries_validates_before_write(self, isolated_memory):
+        from scripts.memory import append_memory_entries
+        with pytest.raises(ValueError, match="Invalid entry type"):
+            append_memory_entries("batch-agent", [
+                {"type": "note", "target": "a", "data": {}},
+                {"type": "bogus", "target": "b", "data": {}},
+            ])
+        assert not (isolated_memory / "batch-agent.json").exists()
+
+    def test_session_saves_on_exit(self, isolated_memory):
+        from scripts.memory import agent_memory_session, load_agent_memory
+        with agent_memory_session("session-agent") as m:
+            m["entries"].append({"type": "scored", "target": "apps/a.html", "data": {}})
+            m["entries"].append({"type": "note", "target": "apps/b.html", "data": {}})
+        entries = load_agent_memory("session-agent")["entries"]
+        assert len(entries) == 2
+        assert all("id" in e for e in entries)
+
+    def test_session_discards_on_error(self, isolated_memory):
+        from scripts.memory import agent_memory_session
+        with pytest.raises(RuntimeError):
+            with agent_memory_session("session-agent") as m:
+                m["entries"].append({"type": "note", "target": "a", "data": {}})
+                raise RuntimeError("boom")
+        assert not (isolated_memory / "session-agent.json").exists()
+
+
+class TestTargetIndex:
+    def test_index_tracks_new_entries(self, isolated_memory):
+        from scripts.memory import append_memory_entry, get_all_entries_for_target
+        append_memory_entry("agent-a", {"type": "note", "target": "apps/x.html", "data": {}})
+        assert len(get_all_entries_for_target("apps/x.html")) == 1
+        append_memory_entry("agent-b", {"type": "note", "target": "apps/x.html", "data": {}})
+        assert len(get_all_entries_for_target("apps/x.html")) == 2
+        assert not (isolated_memory / "_target_index.json").exists()
+
+    def test_result_mutation_does_not_leak(self, isolated_memory):
+        from scripts.memory import append_memory_entry, get_all_entries_for_target
+        append_memory_entry("agent-a", {"type": "note", "target": "apps/x.html", "data": {"n": 1}})
+        first = get_all_entries_for_target("apps/x.html")[0]
+        first["seen"] = True
+        first["data"]["n"] = 2
+        again = get_all_entries_for_target("apps/x.html")[0]
+        assert "seen" not in again and again["data"] == {"n": 1}
+
+    def test_unchanged_files_not_reparsed(self, isolated_memory):
+        from scripts import memory
+        memory.append_memory_entry("agent-a", {"type": "note", "target": "apps/x.html", "data": {}})
+        memory.get_all_entries_for_target("apps/x.html")
+        with patch("scripts.memory._index_memory_file") as index_file:
+            assert len(memory.get_all_entries_for_target("apps/x.html")) == 1
+        index_file.assert_not_called()
+
+    def test_index_sees_direct_file_edits(self, isolated_memory):
+        from scripts.memory import append_memory_entry, get_all_entries_for_target
+        append_memory_entry("agent-a", {"type": "note", "target": "apps/x.html", "data": {}})
+        get_all_entries_for_target("apps/x.html")
+        (isolated_memory / "agent-a.json").write_text(json.dumps({
+            "agent": "agent-a", "entries": [
+                {"id": "1", "type": "note", "target": "apps/y.html", "timestamp": "t"},
+                {"id": "2", "type": "note", "target": "apps/y.html", "timestamp": "t"},
+            ]}))
+        assert get_all_entries_for_target("apps/x.html") == []
+        assert len(get_all_entries_for_target("apps/y.html")) == 2
+
+    def test_index_drops_deleted_files(self, isolated_memory):
+        from scripts.memory import append_memory_entry, get_all_entries_for_target
+        append_memory_entry("agent-a", {"type": "note", "target": "apps/x.html", "data": {}})
+        get_all_entries_for_target("apps/x.html")
+        (isolated_memory / "agent-a.json").unlink()
+        assert get_all_entries_for_target("apps/x.html") == []
+
+    def test_rebuild_target_index(self, isolated_memory):
+        from scripts.memory import append_memory_entry, rebuild_target_index
+        append_memory_entry("agent-a", {"type": "note", "target": "apps/x.html", "data": {}})
+        index = rebuild_target_index()
+        assert "apps/x.html" in index["files"]["agent-a.json"]["targets"]
+
+
+class TestNewId:
+    def test_ids_are_uuid4_strings(self, isolated_memory):
+        import uuid
+        from scripts.memory import _new_id
+        ids = {_new_id() for _ in range(100)}
+        assert len(ids) == 100
+        for i in ids:
+            parsed = uuid.UUID(i)
+            assert parsed.version == 4
+            assert str(parsed) == i
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""Tests for the file-moving helpers in migrate_experimental_ai.py."""
+
+import sys
+from pathlib import Path
+from unittest import mock
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import migrate_experimental_ai as mig
+
+TAG = '<meta name="rappterzoo:category" content="experimental-ai">'
+NEW_TAG = '<meta name="rappterzoo:category" content="visual-art">'
+
+
+def _app(head_padding=0, tag=TAG):
+    """An app with its category tag after head_padding bytes of filler."""
+    return (
+        "<!DOCTYPE html><html><head>" + "<!--" + "x" * head_padding + "-->"
+        + tag + "<title>T</title></head><body>" + "y" * 20000 + "</body></html>"
+    )
+
+
+@pytest.fixture
+def dirs(tmp_path):
+    src_dir = tmp_path / "experimental-ai"
+    dest_dir = tmp_path / "visual-art"
+    src_dir.mkdir()
+    dest_dir.mkdir()
+    return src_dir / "app.html", dest_dir / "app.html"
+
+
+class TestCopyWithMetaCategory:
+    def test_tag_inside_head_window(self, dirs):
+        src, dest = dirs
+        src.write_text(_app())
+        mig.copy_with_meta_category(src, dest, "visual_art")
+        assert dest.read_text() == _app(tag=NEW_TAG)
+        assert src.read_text() == _app()
+
+    def test_tag_beyond_head_window(self, dirs):
+        src, dest = dirs
+        src.write_text(_app(head_padding=mig.HEAD_WINDOW))
+        mig.copy_with_meta_category(src, dest, "visual_art")
+        assert dest.read_text() == _app(head_padding=mig.HEAD_WINDOW, tag=NEW_TAG)
+
+
+class TestMoveWithMetaCategory:
+    def test_tag_inside_head_window(self, dirs):
+        src, dest = dirs
+        src.write_text(_app())
+        mig.move_with_meta_category(src, dest, "visual_art")
+        assert not src.exists()
+        assert dest.read_text() == _app(tag=NEW_TAG)
+        assert list(dest.parent.iterdir()) == [dest]
+
+    def test_tag_beyond_head_window(self, dirs):
+        src, dest = dirs
+        src.write_text(_app(head_padding=mig.HEAD_WINDOW))
+        mig.move_with_meta_category(src, dest, "visual_art")
+        assert not src.exists()
+        assert dest.read_text() == _app(head_padding=mig.HEAD_WINDOW, tag=NEW_TAG)
+
+    def test_untagged_file_is_only_renamed(self, dirs):
+        src, dest = dirs
+        src.write_text(_app(tag=""))
+        inode = src.stat().st_ino
+        with mock.patch.object(mig, "copy_with_meta_category") as copy:
+            mig.move_with_meta_category(src, dest, "visual_art")
+        copy.assert_not_called()
+        assert not src.exists()
+        assert dest.read_text() == _app(tag="")
+        assert dest.stat().st_ino == inode
+
+    def test_patch_failure_restores_source(self, dirs):
+        src, dest = dirs
+        src.write_text(_app())
+
+        def fail_midway(src_path, dest_path, new_category_key):
+            dest_path.write_text("partial")
+            raise OSError("disk full")
+
+        with mock.patch.object(mig, "copy_with_meta_category", side_effect=fail_midway):
+            with pytest.raises(OSError, match="disk full"):
+                mig.move_with_meta_category(src, dest, "visual_art")
+        assert src.read_text() == _app()
+        assert list(dest.parent.iterdir()) == []
+
+    def test_cross_device_move_falls_back_to_copy(self, dirs):
+        src, dest = dirs
+        src.write_text(_app())
+        with mock.patch.object(mig.os, "rename", side_effect=OSError("EXDEV")):
+            mig.move_with_meta_category(src, dest, "visual_art")
+        assert not src.exists()
+        assert dest.read_text() == _app(tag=NEW_TAG)
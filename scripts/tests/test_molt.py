@@ -8,6 +8,7 @@ import hashlib
 import json
 import os
 import shutil
+import sys
 import tempfile
 from pathlib import Path
 from unittest import mock
@@ -288,6 +289,14 @@ class TestValidateMoltOutput:
         assert errors is not None
         assert "large" in errors.lower()
 
+    def test_size_checked_before_js_parse(self):
+        """Badly sized output should be rejected without running the JS check."""
+        tiny_html = "<!DOCTYPE html><html><head><title>T</title></head><body><script>if (</script></body></html>"
+        with mock.patch("molt._check_js_syntax") as check_js:
+            errors = molt_mod.validate_molt_output(tiny_html, 50000)
+        assert "small" in errors.lower()
+        check_js.assert_not_called()
+
     def test_none_input_fails(self):
         errors = molt_mod.validate_molt_output(None, 1000)
         assert errors is not None
@@ -321,6 +330,59 @@ class TestValidateMoltOutput:
         errors = molt_mod.validate_molt_output(shader_html, len(shader_html))
         assert errors is None
 
+    def test_script_in_comment_and_unquoted_module_skipped(self):
+        """Commented-out scripts and type=module without quotes are not JS to check."""
+        html = (
+            '<!DOCTYPE html><html><head><title>T</title></head><body>'
+            '<!-- <script>if (</script> -->'
+            '<script type=module>import x from "./x.js";</script>'
+            '</body></html>'
+        )
+        assert molt_mod.validate_molt_output(html, len(html)) is None
+
+    @pytest.mark.skipif(shutil.which("node") is None, reason="node not installed")
+    def test_node_worker_reused_across_checks(self):
+        """One Node process should serve every block, including non-ASCII code."""
+        assert molt_mod._check_js_syntax('<script>const s = "héllo ✓";</script>') is None
+        worker = molt_mod._node_worker
+        assert molt_mod._check_js_syntax('<script>ok()</script><script>const s = "✓"; let = ;</script>')
+        assert molt_mod._node_worker is worker
+
+    @pytest.mark.skipif(shutil.which("node") is None, reason="node not installed")
+    def test_validated_blocks_not_rechecked(self):
+        """A block that already parsed should not go back to Node."""
+        html = '<script>const unchangedHelper = () => 42;</script>'
+        assert molt_mod._check_js_syntax(html) is None
+        with mock.patch("molt._get_node_worker") as get_worker:
+            assert molt_mod._check_js_syntax(html) is None
+        get_worker.assert_not_called()
+
+    def test_molt_sends_only_changed_block_to_node(self, tmp_project):
+        """Script blocks the molt left unchanged should not go to Node."""
+        from collections import OrderedDict
+        helper = "<script>\n  const helper = () => 42;\n</script>\n"
+        original = SAMPLE_HTML.replace("<script>", helper + "<script>", 1)
+        improved = IMPROVED_HTML.replace("<script>", helper + "<script>", 1)
+        (tmp_project / "apps" / "games-puzzles" / "memory-training-game.html").write_text(original)
+
+        sent = []
+        worker = mock.MagicMock()
+        worker.stdin.write.side_effect = lambda data: sent.append(data)
+        worker.stdout.readline.return_value = b'{"errors": [null]}\n'
+        with mock.patch("molt._get_node_worker", return_value=worker), \
+             mock.patch.object(molt_mod, "_validated_js", OrderedDict()), \
+             mock.patch("molt.copilot_call_with_retry", return_value=improved):
+            result = molt_mod.molt_app(
+                "memory-training-game.html",
+                _manifest=json.loads(json.dumps(SAMPLE_MANIFEST)),
+                _apps_dir=tmp_project / "apps",
+            )
+
+        assert result["status"] == "success"
+        scripts = json.loads(sent[0])["scripts"]
+        assert len(scripts) == 1
+        assert "helper" not in scripts[0]
+
 
 class TestBugPreventionPrompt:
     """Verify the molt prompt includes bug prevention rules."""
@@ -381,6 +443,18 @@ class TestArchiveOperations:
         assert (archive_dir / "v1.html").exists()
         assert (archive_dir / "v2.html").exists()
 
+    def test_replacing_live_file_keeps_archive(self, tmp_project):
+        """A hardlinked archive must survive the live file being rewritten."""
+        archive_dir = tmp_project / "apps" / "archive" / "memory-training-game"
+        src = tmp_project / "apps" / "games-puzzles" / "memory-training-game.html"
+
+        molt_mod.archive_file(src, archive_dir, generation=1)
+        molt_mod._replace_file(src, IMPROVED_HTML.encode())
+
+        assert (archive_dir / "v1.html").read_text() == SAMPLE_HTML
+        assert src.read_text() == IMPROVED_HTML
+        assert not src.with_name(src.name + ".tmp").exists()
+
 
 # ─── Molt Log Tests ──────────────────────────────────────────────────────────
 
@@ -403,9 +477,9 @@ class TestMoltLog:
         }
         molt_mod.append_molt_log(archive_dir, entry)
 
-        log_path = archive_dir / "molt-log.json"
+        log_path = archive_dir / "molt-log.jsonl"
         assert log_path.exists()
-        log = json.loads(log_path.read_text())
+        log = molt_mod.read_molt_log(archive_dir)
         assert len(log) == 1
         assert log[0]["generation"] == 1
 
@@ -425,7 +499,7 @@ class TestMoltLog:
             }
             molt_mod.append_molt_log(archive_dir, entry)
 
-        log = json.loads((archive_dir / "molt-log.json").read_text())
+        log = molt_mod.read_molt_log(archive_dir)
         assert len(log) == 3
         assert [e["generation"] for e in log] == [1, 2, 3]
 
@@ -445,9 +519,20 @@ class TestMoltLog:
         }
         molt_mod.append_molt_log(archive_dir, entry)
 
-        log = json.loads((archive_dir / "molt-log.json").read_text())
+        log = molt_mod.read_molt_log(archive_dir)
         assert log[0]["previousSha256"] == sha
 
+    def test_legacy_json_log_carried_over(self, tmp_project):
+        archive_dir = tmp_project / "apps" / "archive" / "memory-training-game"
+        archive_dir.mkdir(parents=True)
+        (archive_dir / "molt-log.json").write_text(json.dumps([{"generation": 1}], indent=2))
+
+        assert molt_mod.read_molt_log(archive_dir) == [{"generation": 1}]
+        molt_mod.append_molt_log(archive_dir, {"generation": 2})
+
+        assert not (archive_dir / "molt-log.json").exists()
+        assert molt_mod.read_molt_log(archive_dir) == [{"generation": 1}, {"generation": 2}]
+
 
 # ─── Manifest Update Tests ───────────────────────────────────────────────────
 
@@ -520,6 +605,40 @@ class TestResolveAppPath:
                 _apps_dir=tmp_project / "apps",
             )
 
+    def test_sees_app_moved_between_lookups(self, tmp_project):
+        """The cached app index must follow manifest edits made mid-run."""
+        manifest = json.loads(json.dumps(SAMPLE_MANIFEST))
+        apps_dir = tmp_project / "apps"
+        _, cat_key, _ = molt_mod.resolve_app("snake-game.html", _manifest=manifest, _apps_dir=apps_dir)
+        assert cat_key == "games_puzzles"
+
+        entry = manifest["categories"]["games_puzzles"]["apps"].pop()
+        manifest["categories"]["visual_art"]["apps"].append(entry)
+        shutil.move(apps_dir / "games-puzzles" / "snake-game.html", apps_dir / "visual-art" / "snake-game.html")
+
+        path, cat_key, _ = molt_mod.resolve_app("snake-game.html", _manifest=manifest, _apps_dir=apps_dir)
+        assert cat_key == "visual_art"
+        assert path.parent.name == "visual-art"
+
+
+    def test_sees_apps_swapped_between_categories(self, tmp_project):
+        """A swap keeps every category's count, but the lookup must still follow it."""
+        manifest = json.loads(json.dumps(SAMPLE_MANIFEST))
+        apps_dir = tmp_project / "apps"
+        _, cat_key, _ = molt_mod.resolve_app("snake-game.html", _manifest=manifest, _apps_dir=apps_dir)
+        assert cat_key == "games_puzzles"
+
+        games = manifest["categories"]["games_puzzles"]["apps"]
+        art = manifest["categories"]["visual_art"]["apps"]
+        games[-1], art[0] = art[0], games[-1]
+        shutil.move(apps_dir / "games-puzzles" / "snake-game.html", apps_dir / "visual-art" / "snake-game.html")
+        shutil.move(apps_dir / "visual-art" / "pixel-painter.html", apps_dir / "games-puzzles" / "pixel-painter.html")
+
+        path, cat_key, _ = molt_mod.resolve_app("snake-game.html", _manifest=manifest, _apps_dir=apps_dir)
+        assert cat_key == "visual_art"
+        assert path.parent.name == "visual-art"
+        _, cat_key, _ = molt_mod.resolve_app("pixel-painter.html", _manifest=manifest, _apps_dir=apps_dir)
+        assert cat_key == "games_puzzles"
 
 # ─── HTML Parsing Tests ──────────────────────────────────────────────────────
 
@@ -625,11 +744,62 @@ class TestEndToEnd:
         assert live.read_text() == IMPROVED_HTML
 
         # Check molt log
-        log_path = tmp_project / "apps" / "archive" / "memory-training-game" / "molt-log.json"
+        log_path = tmp_project / "apps" / "archive" / "memory-training-game" / "molt-log.jsonl"
         assert log_path.exists()
-        log = json.loads(log_path.read_text())
+        log = molt_mod.read_molt_log(log_path.parent)
         assert len(log) == 1
         assert log[0]["generation"] == 1
+        assert log[0]["previousSha256"] == hashlib.sha256(archive.read_bytes()).hexdigest()
+        assert log[0]["newSha256"] == hashlib.sha256(live.read_bytes()).hexdigest()
+
+    def test_oversized_file_skipped_without_reading(self, tmp_project):
+        """The size cap uses the file's byte size and never reads the file."""
+        with mock.patch("pathlib.Path.read_text") as read_text, \
+             mock.patch("molt.copilot_call_with_retry") as call:
+            result = molt_mod.molt_app(
+                "memory-training-game.html",
+                max_size=100,
+                _manifest=json.loads(json.dumps(SAMPLE_MANIFEST)),
+                _apps_dir=tmp_project / "apps",
+            )
+
+        assert result["status"] == "skipped"
+        assert f"{len(SAMPLE_HTML.encode())} bytes" in result["reason"]
+        read_text.assert_not_called()
+        call.assert_not_called()
+
+    def test_reply_from_interrupted_run_is_reused(self, tmp_project):
+        """A cached reply for the same prompt replaces the Copilot call, then is dropped."""
+        apps_dir = tmp_project / "apps"
+        prompt = molt_mod.build_molt_prompt(SAMPLE_HTML, "memory-training-game.html", 1)
+        cache_path = molt_mod._llm_cache_path(apps_dir / "archive" / ".llm_cache", prompt, "classic")
+        molt_mod._llm_cache_put(cache_path, prompt, IMPROVED_HTML)
+
+        with mock.patch("molt.copilot_call_with_retry") as call:
+            result = molt_mod.molt_app(
+                "memory-training-game.html",
+                adaptive=False,
+                use_contract=False,
+                use_score_gate=False,
+                _manifest=json.loads(json.dumps(SAMPLE_MANIFEST)),
+                _apps_dir=apps_dir,
+            )
+
+        assert result["status"] == "success"
+        call.assert_not_called()
+        assert not cache_path.exists()
+
+    def test_rejected_reply_not_cached(self, tmp_project):
+        with mock.patch("molt.copilot_call_with_retry", return_value="<html>no doctype</html>"):
+            result = molt_mod.molt_app(
+                "memory-training-game.html",
+                adaptive=False,
+                _manifest=json.loads(json.dumps(SAMPLE_MANIFEST)),
+                _apps_dir=tmp_project / "apps",
+            )
+
+        assert result["status"] == "rejected"
+        assert not list((tmp_project / "apps" / "archive" / ".llm_cache").glob("*.json"))
 
     def test_rejection_on_validation_failure(self, tmp_project):
         """If LLM output fails validation, original should be preserved."""
@@ -723,6 +893,16 @@ class TestStatus:
         for s in status:
             assert s["generation"] == 0
 
+    def test_print_status_limit_keeps_top_rows_and_totals(self, capsys):
+        manifest = json.loads(json.dumps(SAMPLE_MANIFEST))
+        manifest["categories"]["visual_art"]["apps"][0]["generation"] = 3
+        molt_mod.print_status(manifest, limit=1)
+        out = capsys.readouterr().out
+        assert "pixel-painter.html" in out
+        assert "snake-game.html" not in out
+        assert "... 2 more" in out
+        assert "1/3 apps have been molted." in out
+
 
 # ─── Rollback Tests ──────────────────────────────────────────────────────────
 
@@ -765,3 +945,177 @@ class TestRollback:
             _apps_dir=tmp_project / "apps",
         )
         assert result["status"] == "failed"
+
+
+# ─── Category Mode Tests ─────────────────────────────────────────────────────
+
+
+class TestCategoryMode:
+    """Test --category batch molting."""
+
+    def _run_main(self, argv, molt_side_effect):
+        manifest = json.loads(json.dumps(SAMPLE_MANIFEST))
+        with mock.patch("sys.argv", ["molt.py"] + argv), \
+             mock.patch("molt.detect_backend", return_value="copilot-cli"), \
+             mock.patch("molt.load_manifest", return_value=manifest), \
+             mock.patch("molt.save_manifest") as save, \
+             mock.patch("molt.molt_app", side_effect=molt_side_effect) as molt_app:
+            code = molt_mod.main()
+        return code, molt_app, save
+
+    def test_molts_every_app_concurrently(self, capsys):
+        code, molt_app, save = self._run_main(
+            ["--category", "games_puzzles", "--concurrency", "2"],
+            lambda f, **kw: {"status": "success", "file": f},
+        )
+        assert code == 0
+        assert sorted(c.args[0] for c in molt_app.call_args_list) == [
+            "memory-training-game.html", "snake-game.html",
+        ]
+        save.assert_called_once()
+        out = capsys.readouterr().out
+        assert "'success': 2" in out
+        assert out.index("memory-training-game.html") < out.index("snake-game.html")
+
+    def test_crashing_molt_still_saves_manifest(self, capsys):
+        def fake_molt(f, **kw):
+            if f == "snake-game.html":
+                raise RuntimeError("boom")
+            return {"status": "success"}
+
+        code, _, save = self._run_main(
+            ["--category", "games_puzzles", "--concurrency", "2"], fake_molt,
+        )
+        assert code == 0
+        save.assert_called_once()
+        out = capsys.readouterr().out
+        assert "'success': 1" in out and "'failed': 1" in out
+        assert "RuntimeError: boom" in out
+
+    def test_concurrent_output_is_labelled(self, capsys):
+        def fake_molt(f, **kw):
+            print("  Calling Copilot CLI", end="")
+            print("...")
+            return {"status": "success"}
+
+        code, _, _ = self._run_main(
+            ["--category", "games_puzzles", "--concurrency", "2", "--verbose"], fake_molt,
+        )
+        assert code == 0
+        lines = capsys.readouterr().out.splitlines()
+        assert sorted(line for line in lines if "Calling" in line) == [
+            "[memory-training-game.html]   Calling Copilot CLI...",
+            "[snake-game.html]   Calling Copilot CLI...",
+        ]
+        assert not isinstance(sys.stdout, molt_mod._LabelledStdout)
+
+    def test_one_app_failing_does_not_stop_others(self, capsys):
+        code, molt_app, _ = self._run_main(
+            ["--category", "games_puzzles"],
+            lambda f, **kw: {"status": "failed" if f == "snake-game.html" else "success"},
+        )
+        assert code == 0
+        out = capsys.readouterr().out
+        assert "'success': 1" in out and "'failed': 1" in out
+
+
+class TestBatchedMolt:
+    """Test --batch-size packing several apps into one Copilot call."""
+
+    def test_parse_batch_output_splits_by_marker(self):
+        raw = (
+            "<<<APP a.html>>>\n<html>A</html>\n<<<END APP>>>\n"
+            "<<<APP b.html>>>\n<html>B</html>\n<<<END APP>>>"
+        )
+        assert molt_mod.parse_batch_molt_output(raw) == {
+            "a.html": "<html>A</html>",
+            "b.html": "<html>B</html>",
+        }
+        assert molt_mod.parse_batch_molt_output(None) == {}
+
+    def test_batch_prompt_wraps_each_app(self):
+        prompt = molt_mod.build_batch_molt_prompt([("a.html", "<p>A</p>"), ("b.html", "<p>B</p>")], 1)
+        assert "<<<APP a.html>>>\n<p>A</p>\n<<<END APP>>>" in prompt
+        assert "<<<APP b.html>>>" in prompt
+        assert "GENERATION 1 FOCUS" in prompt
+
+    def test_one_call_for_the_category(self, tmp_project):
+        batched = "\n".join(
+            f"<<<APP {name}>>>\n{IMPROVED_HTML}\n<<<END APP>>>"
+            for name in ("memory-training-game.html", "snake-game.html")
+        )
+        manifest = json.loads(json.dumps(SAMPLE_MANIFEST))
+        with mock.patch("molt.copilot_call_with_retry", return_value=batched) as call:
+            results = molt_mod.molt_apps_batched(
+                ["memory-training-game.html", "snake-game.html"],
+                4,
+                use_contract=False,
+                use_score_gate=False,
+                _manifest=manifest,
+                _apps_dir=tmp_project / "apps",
+            )
+
+        assert call.call_count == 1
+        assert [(f, r["status"]) for f, r in results] == [
+            ("memory-training-game.html", "success"),
+            ("snake-game.html", "success"),
+        ]
+        games = tmp_project / "apps" / "games-puzzles"
+        assert (games / "snake-game.html").read_text() == IMPROVED_HTML
+
+    def test_app_missing_from_response_falls_back(self, tmp_project):
+        partial = f"<<<APP snake-game.html>>>\n{IMPROVED_HTML}\n<<<END APP>>>"
+        manifest = json.loads(json.dumps(SAMPLE_MANIFEST))
+        with mock.patch("molt.copilot_call_with_retry", side_effect=[partial, IMPROVED_HTML]) as call:
+            results = molt_mod.molt_apps_batched(
+                ["memory-training-game.html", "snake-game.html"],
+                4,
+                use_contract=False,
+                use_score_gate=False,
+                _manifest=manifest,
+                _apps_dir=tmp_project / "apps",
+            )
+
+        assert call.call_count == 2
+        assert all(r["status"] == "success" for _, r in results)
+
+    def test_crashing_molt_reported_as_failed(self, tmp_project):
+        def fake_molt(ident, **kw):
+            if ident == "snake-game.html":
+                raise RuntimeError("boom")
+            return {"status": "success"}
+
+        with mock.patch("molt.copilot_call_with_retry", return_value=""), \
+             mock.patch("molt.molt_app", side_effect=fake_molt):
+            results = molt_mod.molt_apps_batched(
+                ["memory-training-game.html", "snake-game.html"],
+                4,
+                _manifest=json.loads(json.dumps(SAMPLE_MANIFEST)),
+                _apps_dir=tmp_project / "apps",
+            )
+
+        assert results == [
+            ("memory-training-game.html", {"status": "success"}),
+            ("snake-game.html", {"status": "failed", "reason": "RuntimeError: boom"}),
+        ]
+
+    def test_unbatched_apps_keep_requested_mode(self, tmp_project):
+        partial = f"<<<APP snake-game.html>>>\n{IMPROVED_HTML}\n<<<END APP>>>"
+        manifest = json.loads(json.dumps(SAMPLE_MANIFEST))
+        with mock.patch("molt.copilot_call_with_retry", return_value=partial), \
+             mock.patch("molt.molt_app", return_value={"status": "success"}) as molt_app:
+            molt_mod.molt_apps_batched(
+                ["memory-training-game.html", "snake-game.html"],
+                4,
+                adaptive=True,
+                surgical=True,
+                _manifest=manifest,
+                _apps_dir=tmp_project / "apps",
+            )
+
+        modes = {c.args[0]: (c.kwargs["adaptive"], c.kwargs["surgical"], "_llm_output" in c.kwargs)
+                 for c in molt_app.call_args_list}
+        assert modes == {
+            "memory-training-game.html": (True, True, False),
+            "snake-game.html": (False, False, True),
+        }
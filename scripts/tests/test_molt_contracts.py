@@ -266,7 +266,7 @@ class TestFeatureContractIntegration:
         assert result["status"] in ("rejected", "success")
 
     def test_contract_logged_in_molt_log(self, tmp_project):
-        """Feature preservation should be recorded in molt-log.json."""
+        """Feature preservation should be recorded in molt-log.jsonl."""
         tmp_path, apps_dir, manifest = tmp_project
 
         with mock.patch("molt.copilot_call_with_retry", return_value=IMPROVED_HTML):
@@ -281,9 +281,9 @@ class TestFeatureContractIntegration:
 
         assert result["status"] == "success"
 
-        log_path = apps_dir / "archive" / "test-particle-game" / "molt-log.json"
+        log_path = apps_dir / "archive" / "test-particle-game" / "molt-log.jsonl"
         assert log_path.exists()
-        log = json.loads(log_path.read_text())
+        log = molt_mod.read_molt_log(log_path.parent)
         assert len(log) >= 1
         assert "feature_preservation" in log[-1]
         assert log[-1]["feature_preservation"] == 1.0
@@ -726,8 +726,7 @@ class TestMoltLogMode:
                 _apps_dir=apps_dir,
             )
 
-        log_path = apps_dir / "archive" / "test-particle-game" / "molt-log.json"
-        log = json.loads(log_path.read_text())
+        log = molt_mod.read_molt_log(apps_dir / "archive" / "test-particle-game")
         assert log[-1]["mode"] == "classic"
 
     def test_adaptive_mode_logged(self, tmp_project):
@@ -752,6 +751,5 @@ class TestMoltLogMode:
                 _apps_dir=apps_dir,
             )
 
-        log_path = apps_dir / "archive" / "test-particle-game" / "molt-log.json"
-        log = json.loads(log_path.read_text())
+        log = molt_mod.read_molt_log(apps_dir / "archive" / "test-particle-game")
         assert log[-1]["mode"] == "adaptive"